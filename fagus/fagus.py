@@ -2,6 +2,7 @@
 
 import copy as cp
 from datetime import datetime, date, time
+from itertools import repeat
 import collections.abc as c_abc
 from typing import (
     Union,
@@ -28,8 +29,13 @@ from .utils import (
     INF,
     _filter_r,
     _copy_node,
+    _deepcopy_node,
     _is,
+    _is_node,
     _copy_any,
+    _split_str,
+    _parse_index,
+    _OptionsMethod,
     OptStr,
     OptInt,
     OptBool,
@@ -64,6 +70,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
     options can be found in README.md.
     """
 
+    __slots__ = ("root", "_options", "_root_hash", "__weakref__")
+
     root: Collection[Any]
     """ Contains the root note the Fagus-object is wrapped around
 
@@ -71,6 +79,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
     ``a.root = ["ex"]``. The root node is also returned when a is called: ``a()``, examples in ``Fagus.__call__()``.
     """
 
+    _root_hash: Optional[int]  # hash of root, cached if root is immutable. Reset whenever root is set
+
     def __init__(
         self,
         root: Optional[Collection[Any]] = None,
@@ -119,7 +129,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 won't modify the root node that was passed here itself. Default False
         """
         if root is None:
-            root = [] if Fagus.default_node_type == "l" or default_node_type == "l" else {}
+            root = [] if FagusMeta._cls_option_values["default_node_type"] == "l" or default_node_type == "l" else {}
         if copy:
             root = Fagus.__copy__(root)
         if isinstance(root, Fagus):
@@ -128,11 +138,22 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         else:
             self.root = root
             self._options = None
-        self.options = self.__options  # Renaming __options to options. This is done at runtime to prevent overriding
-        del self.__options  # options in FagusMeta, which is still supposed to run if Fagus.options() is called
-        for kw, value in locals().copy().items():
-            if kw not in ("copy", "self", "root") and value is not ...:
-                setattr(self, kw, value)
+        for kw, value in (  # the options are verified and stored directly, without going through __setattr__()
+            ("node_types", node_types),
+            ("list_insert", list_insert),
+            ("path_split", path_split),
+            ("fagus", fagus),
+            ("default_node_type", default_node_type),
+            ("default", default),
+            ("if_", if_),
+            ("iter_fill", iter_fill),
+        ):
+            if value is not ...:
+                if self._options is None:
+                    self._options = {}
+                self._options[kw] = Fagus.__verify_option__(kw, value)
+        if mod_functions is not ...:
+            setattr(self, "mod_functions", mod_functions)
 
     def get(
         self: Collection[Any],
@@ -168,15 +189,14 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             the value if the path exists, or default if it doesn't exist
         """
         node = self.root if isinstance(self, Fagus) else self
-        if isinstance(path, str):
-            t_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else ()
-        else:
-            t_path = tuple(path) if _is(path, c_abc.Collection) else (path,)
+        t_path = Fagus._path_keys(self, path, path_split)
         if t_path:
             for node_name in t_path:
                 try:
                     if _is(node, c_abc.Mapping, c_abc.Sequence):
-                        node = node[node_name if isinstance(node, c_abc.Mapping) else int(node_name)]  # type: ignore
+                        node = node[  # type: ignore
+                            node_name if isinstance(node, c_abc.Mapping) or type(node_name) is int else int(node_name)
+                        ]
                     else:
                         node = Fagus._opt(self, "default", default)
                         break
@@ -235,18 +255,21 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             FagusIterator with one tuple for each leaf-node, containing the keys of the parent-nodes until the leaf
         """
         iter_fill = Fagus._opt(self, "iter_fill", iter_fill)
-        node = Fagus.get(self, path, (), True, copy and iter_fill, path_split)
+        fagus = Fagus._opt(self, "fagus", fagus)
+        iter_nodes = Fagus._opt(self, "iter_nodes", iter_nodes)
+        copy_node = bool(copy and iter_fill)  # if iter_fill is set, copy the whole node now, else copy each leaf
+        node = Fagus.get(self, path, (), False, copy_node, path_split)
         if not _is(node, c_abc.Collection) or isinstance(filter_, Fil) and not filter_.match_extra_filters(node):
-            node = Fagus.child(self, ())
+            node = ()
         return FagusIterator(
-            node,
+            Fagus.child(self, node),
             max_depth,
             filter_,
-            Fagus._opt(self, "fagus", fagus),
+            fagus,
             iter_fill,
             select,
-            Fagus._opt(self, "iter_nodes", iter_nodes),
-            copy and not iter_fill,
+            iter_nodes,
+            copy and not copy_node,
             filter_ends,
         )
 
@@ -278,21 +301,16 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         Raises:
             TypeError: if the root node needs to be modified and isn't modifiable (e.g. tuple or frozenset)
         """
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
-        if copy:
-            parent_node = Fagus.get(self, l_path[:-1], _None, False, copy, path_split)
+        l_path = Fagus._split_path(self, path, path_split)
+        if copy:  # the node is copied while it's filtered, so it's enough to look it up without modifying anything
+            node = Fagus.get(self, l_path, _None, False)
         else:
-            parent_node = Fagus._get_mutable_node(self, l_path)
-        node = _None if parent_node is _None else Fagus.get(parent_node, l_path[-1:], _None, False)
+            parent_node: Any = Fagus._get_mutable_node(self, l_path)
+            node = parent_node if parent_node is _None or not l_path else Fagus._get_value(parent_node, l_path[-1])
         if node is _None or not _is(node, c_abc.Collection):
             filtered = cast(Collection[Any], Fagus._opt(self, "default", default))
         else:
-            filtered = _filter_r(node, copy, filter_)
-            if not filter_.match_extra_filters(node):
-                filtered.clear()  # type: ignore
+            filtered = _filter_r(node, copy, filter_, check_extra_first=True)
             if not copy:
                 if path:
                     parent_node[int(l_path[-1]) if isinstance(parent_node, c_abc.Sequence) else l_path[-1]] = filtered
@@ -332,22 +350,16 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         Raises:
             TypeError: if the root node needs to be modified and isn't modifiable (e.g. tuple or frozenset)
         """
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
-        if copy:
-            parent_node = Fagus.get(self, l_path[:-1], _None, False, copy, path_split)
+        l_path = Fagus._split_path(self, path, path_split)
+        if copy:  # the node is copied while it's filtered, so it's enough to look it up without modifying anything
+            node = Fagus.get(self, l_path, _None, False)
         else:
-            parent_node = Fagus._get_mutable_node(self, l_path)
-        node = _None if parent_node is _None else Fagus.get(parent_node, l_path[-1:], _None, False)
+            parent_node: Any = Fagus._get_mutable_node(self, l_path)
+            node = parent_node if parent_node is _None or not l_path else Fagus._get_value(parent_node, l_path[-1])
         if node is _None or not _is(node, c_abc.Collection):
             filter_in, filter_out = 2 * (Fagus._opt(self, "default", default),)
         else:
-            filter_in, filter_out = Fagus._split_r(node, copy, filter_)
-            if filter_ and not filter_.match_extra_filters(node):
-                filter_in.clear()
-                filter_out = node
+            filter_in, filter_out = Fagus._split_r(node, copy, filter_, check_extra_first=True)
             if not copy:
                 if path:
                     parent_node[int(l_path[-1]) if isinstance(parent_node, c_abc.Sequence) else l_path[-1]] = filter_in
@@ -364,7 +376,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
 
     @staticmethod
     def _split_r(
-        node: Collection[Any], copy: bool, filter_: Optional[Fil], index: int = 0
+        node: Collection[Any], copy: bool, filter_: Optional[Fil], index: int = 0, check_extra_first: bool = False
     ) -> Tuple[
         Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]],
         Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]],
@@ -376,29 +388,42 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             copy: creates copies instead of directly referencing nodes included in the filter
             filter_: Fil-object in which the filtering-criteria are specified
             index: index in the current filter-object
+            check_extra_first: check the extra filters (CFil, VFil) on node first. If they don't match, the whole node
+                is split out without iterating through it
 
         Returns:
             the filtered node
         """
         filter_in: Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]]
         filter_out: Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]]
-        action: Optional[str]
+        add_in: Optional[Callable[[Any], Any]]
+        add_out: Optional[Callable[[Any], Any]]
+        items: Iterable[Tuple[Any, Any]]
         match_key: Optional[Callable[[Any, int, Any], Tuple[bool, Union[KFil, None], int]]]
         if isinstance(node, c_abc.Mapping):
-            filter_in, filter_out, action, match_key = {}, {}, None, filter_.match if filter_ else None
+            filter_in, filter_out, add_in, add_out = {}, {}, None, None
+            items, match_key = node.items(), filter_.match if filter_ else None
         elif isinstance(node, c_abc.Sequence):
-            filter_in, filter_out, action, match_key = [], [], "append", filter_.match_list if filter_ else None
+            filter_in, filter_out = [], []
+            add_in, add_out, items = filter_in.append, filter_out.append, enumerate(node)
+            match_key = filter_.match_list if filter_ else None
         else:
-            filter_in, filter_out, action, match_key = set(), set(), "add", None
-        for k, v in node.items() if isinstance(node, c_abc.Mapping) else enumerate(node):
+            filter_in, filter_out = set(), set()
+            add_in, add_out, items, match_key = filter_in.add, filter_out.add, enumerate(node), None
+        if filter_ is None:  # the whole node passes, so filter_in can be built in one go by _filter_r
+            return _filter_r(node, copy, None), filter_out  # type: ignore
+        if check_extra_first and not filter_.match_extra_filters(node, index):
+            return filter_in, _copy_any(node) if copy else node  # type: ignore
+        node_len = len(node)
+        for k, v in items:
             v_in: Union[type, MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]] = _None
             v_out: Union[type, MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]] = _None
-            match_k = match_key(k, index, len(node)) if callable(match_key) else (True, filter_, index + 1)
+            match_k = match_key(k, index, node_len) if match_key else (True, filter_, index + 1)
             match_v = False
             if match_k[0]:
                 if match_k[1] is None:
                     match_v = True
-                elif _is(v, c_abc.Collection):
+                elif _is_node(v):
                     if match_k[1].match_extra_filters(v, match_k[2]):
                         v_in, v_out = Fagus._split_r(v, copy, *match_k[1:])  # type: ignore
                         match_v = bool(v) == bool(v_in)
@@ -407,8 +432,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 if match_v or v_in is not _None:
                     if v_in is _None:
                         v_in = v
-                    if action:
-                        getattr(filter_in, action)(_copy_any(v_in) if copy else v_in)
+                    if add_in:
+                        add_in(_copy_any(v_in) if copy else v_in)
                     else:
                         filter_in[k] = _copy_any(v_in) if copy else v_in  # type: ignore
             if not match_v or v_out is not _None:
@@ -416,8 +441,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                     v_out = v
                 elif bool(v) != bool(v_out):
                     continue
-                if action:
-                    getattr(filter_out, action)(_copy_any(v_out) if copy else v_out)
+                if add_out:
+                    add_out(_copy_any(v_out) if copy else v_out)
                 else:
                     filter_out[k] = _copy_any(v_out) if copy else v_out  # type: ignore
         return filter_in, filter_out
@@ -753,152 +778,207 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         root = self.root if isinstance(self, Fagus) else self
         if_ = Fagus._opt(self, "if_", if_)
         if if_ is not _None and not (
-            if_(value) if callable(if_) else (value in if_ if _is(if_, c_abc.Container) else if_ == value)
+            if_(value)
+            if callable(if_)
+            else (
+                value in if_
+                if type(if_) in (tuple, list, set, frozenset) or _is(if_, c_abc.Container)
+                else if_ == value
+            )
         ):
             return Fagus.child(self, root) if Fagus._opt(self, "fagus", fagus) else root
         node_types = Fagus._opt(self, "node_types", node_types)
         if copy:
             root = Fagus.__copy__(root)
         node = root
-        if isinstance(path, str):
-            l_path: List[Any] = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path = Fagus._path_keys(self, path, path_split)  # read-only, list-indices are parsed while traversing
         if l_path:
-            try:
-                next_index: Union[type, int] = int(l_path[0])
-            except (ValueError, TypeError):
-                next_index = _None
-            list_insert = Fagus._opt(self, "list_insert", list_insert)
             default_node_type = Fagus._opt(self, "default_node_type", default_node_type)
-            nodes = [root]
-            for i in range(len(l_path)):
-                is_list = _is(node, c_abc.Sequence)
+            if default_node_type == "d" and type(root) is dict and not node_types.strip():
+                parent = Fagus._dict_parent(root, l_path)
+                if parent is not None:
+                    parent[l_path[-1]] = Fagus._put_value(parent.get(l_path[-1], _None), value, action, index)
+                    return Fagus.child(self, root) if Fagus._opt(self, "fagus", fagus) else root
+            list_insert = Fagus._opt(self, "list_insert", list_insert)
+            mutable_upto = -1  # the nodes in l_path are made mutable on the first write, that covers all later levels
+            # the loop below runs for each level in path, so look these up only once
+            sequence, mapping, sequence_types = c_abc.Sequence, c_abc.Mapping, FagusMeta._sequence_types
+            mutable_node, put_value = Fagus._mutable_path_node, Fagus._put_value
+            last = len(l_path) - 1
+            next_value: Any = _None
+            # "d" or "l" if the node type is fixed for the level in l_path, or "" for don't care
+            level_types = [t.strip() for t in node_types[: last + 1].ljust(last + 1)]
+            indices: List[Any] = [_parse_index(key) for key in l_path]  # _None if the key can't be a list-index
+            indices.append(_None)
+            # for each level, whether a new node created under the key there shall be a list (otherwise a dict)
+            new_lists = [
+                t == "l" or not t and default_node_type == "l" and indices[j + 1] is not _None
+                for j, t in enumerate(level_types)
+            ]
+            for i, node_key in enumerate(l_path):
+                node_type = level_types[i]
+                is_list = type(node) is not dict and (isinstance(node, sequence_types) or _is(node, sequence))
                 if is_list:
-                    if next_index is _None:
-                        raise ValueError(f"Can't parse numeric list-index from {l_path[i]}.")
-                    node_key = cast(int, next_index)
-                else:
-                    node_key = l_path[i]
-                try:
-                    next_index = int(l_path[i + 1]) if i < len(l_path) - 1 else _None
-                except (ValueError, TypeError):
-                    next_index = _None
-                next_node = (
-                    c_abc.Sequence
-                    if node_types[i : i + 1] == "l"
-                    or not node_types[i : i + 1].strip()
-                    and default_node_type == "l"
-                    and next_index is not _None
-                    else c_abc.Mapping
-                )
+                    if indices[i] is _None:
+                        raise ValueError(f"Can't parse numeric list-index from {node_key}.")
+                    node_key = indices[i]
+                next_index = indices[i + 1]
+                next_node = sequence if new_lists[i] else mapping
                 if is_list:
-                    l_path[i] = node_key
                     if node_key >= len(node) and list_insert:
-                        if nodes:
-                            node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                            nodes.clear()
-                        node.append([] if next_node is c_abc.Sequence else {})  # type: ignore
+                        if mutable_upto < i:
+                            node, mutable_upto = mutable_node(root, l_path, i, node), last
+                        node.append([] if next_node is sequence else {})  # type: ignore
                         node_key = -1
                     elif node_key < -len(node):
-                        if nodes:
-                            node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                            nodes.clear()
-                        node.insert(0, [] if next_node is c_abc.Sequence else {})  # type: ignore
+                        if mutable_upto < i:
+                            node, mutable_upto = mutable_node(root, l_path, i, node), last
+                        node.insert(0, [] if next_node is sequence else {})  # type: ignore
                         node_key = 0
-                    if i == len(l_path) - 1:
-                        if nodes:
-                            node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                            nodes.clear()
+                    if i == last:
+                        if mutable_upto < i:
+                            node, mutable_upto = mutable_node(root, l_path, i, node), last
                         if list_insert <= 0:
-                            node.insert(node_key, Fagus._put_value(_None, value, action, index))  # type: ignore
+                            node.insert(node_key, put_value(_None, value, action, index))  # type: ignore
                         else:
-                            node[node_key] = Fagus._put_value(node[node_key], value, action, index)  # type: ignore
+                            node[node_key] = put_value(node[node_key], value, action, index)  # type: ignore
                     else:
                         if list_insert <= 0:
-                            if nodes:
-                                node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                                nodes.clear()
-                            node.insert(node_key, [] if next_node is c_abc.Sequence else {})  # type: ignore
+                            if mutable_upto < i:
+                                node, mutable_upto = mutable_node(root, l_path, i, node), last
+                            next_value = [] if next_node is sequence else {}
+                            node.insert(node_key, next_value)  # type: ignore
                             list_insert = INF
                         else:
+                            next_value = node[node_key]  # type: ignore
                             next_node_type = (
-                                c_abc.Mapping
-                                if isinstance(node[node_key], c_abc.Mapping)  # type: ignore
-                                else (c_abc.Sequence if _is(node[node_key], c_abc.Sequence) else _None)  # type: ignore
+                                mapping
+                                if isinstance(next_value, mapping)
+                                else (
+                                    sequence
+                                    if isinstance(next_value, sequence_types) or _is(next_value, sequence)
+                                    else _None
+                                )
                             )
                             if next_node_type is _None or (
                                 next_node != next_node_type
-                                if node_types[i : i + 1].strip()
-                                else next_node_type is c_abc.Sequence and next_index is _None
+                                if node_type
+                                else next_node_type is sequence and next_index is _None
                             ):
-                                if nodes:
-                                    node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                                    nodes.clear()
-                                node[node_key] = [] if next_node is c_abc.Sequence else {}  # type: ignore
-                elif isinstance(node, c_abc.Mapping):  # isinstance(node, dict)
-                    if i == len(l_path) - 1:
-                        if nodes:
-                            node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                            nodes.clear()
-                        node[node_key] = Fagus._put_value(  # type: ignore
+                                if mutable_upto < i:
+                                    node, mutable_upto = mutable_node(root, l_path, i, node), last
+                                next_value = node[node_key] = [] if next_node is sequence else {}  # type: ignore
+                elif isinstance(node, mapping):  # isinstance(node, dict)
+                    if i == last:
+                        if mutable_upto < i:
+                            node, mutable_upto = mutable_node(root, l_path, i, node), last
+                        node[node_key] = put_value(  # type: ignore
                             node.get(node_key, _None), value, action, index  # type: ignore
                         )
                     else:
                         next_value = node.get(node_key, _None)
                         next_node_type = (
-                            c_abc.Mapping
-                            if isinstance(next_value, c_abc.Mapping)
-                            else (c_abc.Sequence if _is(next_value, c_abc.Sequence) else _None)
+                            mapping
+                            if isinstance(next_value, mapping)
+                            else (
+                                sequence
+                                if isinstance(next_value, sequence_types) or _is(next_value, sequence)
+                                else _None
+                            )
                         )
                         if next_node_type is _None or (
                             next_node != next_node_type
-                            if node_types[i : i + 1].strip()
-                            else next_node_type is c_abc.Sequence and next_index is _None
+                            if node_type
+                            else next_node_type is sequence and next_index is _None
                         ):
-                            if nodes:
-                                node = Fagus._ensure_mutable_node(nodes, l_path[: i + 1])
-                                nodes.clear()
-                            node[node_key] = [] if next_node is c_abc.Sequence else {}  # type: ignore
-                node = node[node_key]  # type: ignore
-                if nodes:
-                    nodes.append(node)
+                            if mutable_upto < i:
+                                node, mutable_upto = mutable_node(root, l_path, i, node), last
+                            next_value = node[node_key] = [] if next_node is sequence else {}  # type: ignore
+                else:
+                    next_value = node[node_key]  # type: ignore
+                # the child in next_value has been looked up (or created) above, so it isn't looked up again here
+                node = next_value
                 list_insert -= 1
         else:
-            if not _is(root, c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet):
+            root_type = type(root)  # checked against the builtin types first, as ABC isinstance-checks are slower
+            if root_type not in FagusMeta._mutable_types and not _is(
+                root, c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet
+            ):
                 raise TypeError(f"Can't modify root node self having the immutable type {type(self).__name__}.")
-            if isinstance(root, c_abc.MutableMapping) and action == "update":
-                root.update(value)
-            elif isinstance(root, c_abc.MutableSequence) and action in ("append", "extend", "insert"):
-                if action == "insert":
-                    root.insert(index, value)
+            if action == "update" and (
+                root_type is dict or root_type is not set and isinstance(root, c_abc.MutableMapping)
+            ):
+                root.update(value)  # type: ignore
+            elif action in ("append", "extend", "insert") and (
+                root_type is list or root_type is not dict and isinstance(root, c_abc.MutableSequence)
+            ):
+                if action == "append":
+                    root.append(value)  # type: ignore
+                elif action == "extend":
+                    root.extend(value)  # type: ignore
+                else:
+                    root.insert(index, value)  # type: ignore
+            elif action in ("add", "update") and (
+                root_type is set or root_type is not dict and isinstance(root, c_abc.MutableSet)
+            ):
+                if action == "add":
+                    root.add(value)  # type: ignore
                 else:
-                    getattr(root, action)(value)
-            elif isinstance(root, c_abc.MutableSet) and action in ("add", "update"):
-                getattr(root, action)(value)
+                    root.update(value)  # type: ignore
             elif not action == "parent":
                 raise TypeError(
                     f"Can't {action} value {'to' if action in ('add', 'append') else 'in'} root {type(root).__name__}."
                 )
         return Fagus.child(self, root) if Fagus._opt(self, "fagus", fagus) else root
 
+    @staticmethod
+    def _dict_parent(root: Dict[Any, Any], l_path: Sequence[Any]) -> Optional[Dict[Any, Any]]:
+        """Internal fast path for _build_node() when all the nodes in path are (or will be created as) dicts
+
+        Traverses the dicts in path, creating the missing ones in the same way as _build_node() would do it without
+        node_types and with default_node_type "d".
+
+        Args:
+            root: the dict to start in
+            l_path: list of keys, the last key is not traversed
+
+        Returns:
+            the dict the last key in l_path shall be set in, or None if a node in path is not a dict. In that case,
+            _build_node() must handle the path (the dicts that might have been created here are just traversed then)
+        """
+        node = root
+        for i in range(len(l_path) - 1):
+            next_node = node.get(l_path[i], _None)
+            if type(next_node) is not dict:
+                if (
+                    isinstance(next_node, c_abc.Mapping)
+                    or isinstance(next_node, FagusMeta._sequence_types)
+                    or _is(next_node, c_abc.Sequence)
+                ):
+                    return None
+                next_node = node[l_path[i]] = {}
+            node = next_node
+        return node
+
     @staticmethod
     def _put_value(node: Union[Collection[Any], type], value: Any, action: str, index: int) -> Any:
         """internal function that sets, appends or adds value as the last step in building a node"""
         if action == "set":
             return value
         if action in ("append", "extend", "insert"):
-            if not _is(node, c_abc.MutableSequence):
+            if type(node) is not list and not _is(node, c_abc.MutableSequence):
                 if _is(node, c_abc.Iterable):
                     node = list(cast(Iterable[Any], node))
                 elif node is _None:
                     node = []
                 else:
                     node = [node]
-            if action == "insert":
-                node.insert(index, value)  # type: ignore
+            if action == "append":
+                node.append(value)  # type: ignore
+            elif action == "extend":
+                node.extend(value)  # type: ignore
             else:
-                getattr(node, action)(value)
+                node.insert(index, value)  # type: ignore
         elif action in ("add", "update"):
             if node is _None:
                 return (
@@ -909,7 +989,12 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                     else {value}
                 )
             else:
-                if not isinstance(node, (c_abc.MutableSet, c_abc.MutableMapping)):
+                node_type = type(node)  # checked against the builtin types first, as ABC isinstance-checks are slower
+                if (
+                    node_type is not dict
+                    and node_type is not set
+                    and not isinstance(node, (c_abc.MutableSet, c_abc.MutableMapping))
+                ):
                     try:
                         node = (
                             dict(node)
@@ -920,10 +1005,15 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                         )
                     except (TypeError, ValueError):
                         node = set(node) if _is(node, c_abc.Iterable) else {node}  # type: ignore
-                if isinstance(node, c_abc.MutableMapping) and not isinstance(value, c_abc.Mapping):
+                if (
+                    type(node) is dict or type(node) is not set and isinstance(node, c_abc.MutableMapping)
+                ) and not isinstance(value, c_abc.Mapping):
                     return set(value) if _is(value, c_abc.Iterable) else {value}
                     # makes no sense to convert existing node to a set if it's a Mapping, so just return set(value)
-                getattr(node, action)(value)
+                if action == "add":
+                    node.add(value)  # type: ignore
+                else:
+                    node.update(value)  # type: ignore
         else:
             raise ValueError(
                 f"Invalid action for _build_node(): {action}, must be one of add, append, extend, insert, set, update"
@@ -967,10 +1057,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 defines that the node shall be a list (if node-types is not l, the node will be replaced with a dict)
             TypeError: if the root node needs to be modified and isn't modifiable (e.g. tuple or frozenset)
         """
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path = Fagus._split_path(self, path, path_split)
         parent_node = Fagus._get_mutable_node(
             self, l_path, Fagus._opt(self, "list_insert", list_insert), Fagus._opt(self, "node_types", node_types)
         )
@@ -978,7 +1065,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             value = Fagus._opt(self, "default", default)
             Fagus.set(self, value, path, node_types, list_insert, path_split, False, _None, default_node_type)
         else:
-            value = Fagus.get(cast(Collection[Any], parent_node), l_path[-1], _None, fagus=False)
+            value = Fagus._get_value(parent_node, l_path[-1])
             if value is _None or (list_insert == len(l_path) - 1 and isinstance(parent_node, c_abc.MutableSequence)):
                 value = Fagus._opt(self, "default", default)
                 if isinstance(parent_node, c_abc.MutableSequence):
@@ -1036,16 +1123,13 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             TypeError: if the root node needs to be modified and isn't modifiable (e.g. tuple or frozenset)
         """
         root = self.root if isinstance(self, Fagus) else self
-        if isinstance(path, str):
-            l_path: List[Any] = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path: List[Any] = Fagus._split_path(self, path, path_split)
         list_insert = Fagus._opt(self, "list_insert", list_insert)
         parent = Fagus._get_mutable_node(
             self, l_path, list_insert=list_insert, node_types=Fagus._opt(self, "node_types", node_types)
         )
         if isinstance(parent, (c_abc.MutableMapping, c_abc.MutableSequence)) and list_insert != len(l_path):
-            old_value = Fagus.get(parent, l_path[-1], _None, fagus=False)
+            old_value = Fagus._get_value(parent, l_path[-1])
             if replace_value:
                 if isinstance(parent, c_abc.MutableSequence):
                     if list_insert == len(l_path) - 1:
@@ -1110,14 +1194,12 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         f_iter = Fagus.iter(base, max_depth, filter_=filter_, fagus=False, iter_fill=_None, iter_nodes=True)
         if replace_value:
             parent, last_deepest = None, None
-            for deepest_change, parent_not_deepest, *base_keys, parent_, key, old_value in (
-                (f_iter.deepest_change, f_iter.deepest_change < (len(p) - 3) / 2, *p[1::2], *p[-3:]) for p in f_iter
-            ):
-                if parent_not_deepest or last_deepest != deepest_change:
-                    if not _is(parent_, c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet):
-                        parent = Fagus._get_mutable_node(base, base_keys)
-                    else:
-                        parent = parent_
+            for p in f_iter:  # p is (node, key, node, key, ..., parent, key, old_value), as iter_nodes is set
+                deepest_change, key, old_value = f_iter.deepest_change, p[-2], p[-1]
+                if deepest_change < (len(p) - 3) / 2 or last_deepest != deepest_change:
+                    parent = p[-3]
+                    if not _is(parent, c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet):
+                        parent = Fagus._get_mutable_node(base, list(p[1::2]))  # the keys are only sliced out if needed
                     last_deepest = deepest_change
                 if isinstance(parent, c_abc.MutableSet):
                     parent.remove(old_value)
@@ -1125,8 +1207,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 else:
                     parent[key] = mod_function(old_value)  # type: ignore
         else:
-            for *_, old_value in f_iter:
-                mod_function(old_value)
+            for p in f_iter:  # indexing p is cheaper than star-unpacking it, which builds a list for every leaf
+                mod_function(p[-1])
         return Fagus.child(self, base) if Fagus._opt(self, "fagus", fagus) else base
 
     def serialize(
@@ -1181,10 +1263,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             ValueError: if tuple_keys is not defined in mod_functions and a dict has tuples as keys
             Exception: Can raise any exception if it occurs in one of the mod_functions
         """
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path = Fagus._split_path(self, path, path_split)
         node = Fagus._get_mutable_node(
             self,
             l_path,
@@ -1212,63 +1291,67 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 "mod_functions must be a dict with types (or tuples of types) as keys and function pointers "
                 "(either lambda or wrapped in TFunc-nodeects) as values."
             )
-        return Fagus._serialize_r(
-            node,  # type: ignore
-            {
-                **{
-                    datetime: lambda x: x.isoformat(" ", "seconds"),
-                    date: lambda x: x.isoformat(),
-                    time: lambda x: x.isoformat("seconds"),
-                    "default": lambda x: repr(x),
-                },
-                **({} if mod_functions is None else mod_functions),
+        mod_functions = {
+            **{
+                datetime: lambda x: x.isoformat(" ", "seconds"),
+                date: lambda x: x.isoformat(),
+                time: lambda x: x.isoformat("seconds"),
+                "default": lambda x: repr(x),
             },
-        )
+            **({} if mod_functions is None else mod_functions),
+        }
+        type_functions: Dict[Union[type, str], Callable[[Any], Any]] = {}
+        for types, mod_function in mod_functions.items():  # one type per key, to find mod_functions in one lookup
+            for type_ in types if _is(types, c_abc.Collection) else (types,):  # type: ignore
+                type_functions.setdefault(type_, mod_function)  # type: ignore
+        return Fagus._serialize_r(node, type_functions)  # type: ignore
 
     @staticmethod
     def _serialize_r(
         node: Union[Dict[Any, Any], List[Any]],
-        mod_functions: Mapping[Union[type, Tuple[type], str], Callable[[Any], Any]],
+        mod_functions: Mapping[Union[type, str], Callable[[Any], Any]],
     ) -> Union[Dict[Any, Any], List[Any]]:
-        """Recursive function that returns a node where all the keys and values are serializable"""
-        for k, v in list(node.items() if isinstance(node, c_abc.MutableMapping) else enumerate(node)):
-            ny_k: Any = _None
-            ny_v: Any = _None
-            if not isinstance(k, (bool, float, int, str)) and k is not None:
-                if isinstance(k, tuple):
-                    if "tuple_keys" in mod_functions:
-                        ny_k = mod_functions["tuple_keys"](k)
+        """Function that returns a node where all the keys and values are serializable
+
+        The sub-nodes are processed from a stack instead of through recursion, which saves a Python-call for each node
+        """
+        stack = [node]
+        while stack:
+            node_ = stack.pop()
+            for k, v in list(node_.items() if isinstance(node_, c_abc.MutableMapping) else enumerate(node_)):
+                ny_k: Any = _None
+                ny_v: Any = _None
+                if not isinstance(k, (bool, float, int, str)) and k is not None:
+                    if isinstance(k, tuple):
+                        if "tuple_keys" in mod_functions:
+                            ny_k = mod_functions["tuple_keys"](k)
+                        else:
+                            raise ValueError(
+                                "Dicts with composite keys (tuples) are not supported in serialized objects. "
+                                'Use "tuple_keys" to define a specific mod_function for these dict-keys.'
+                            )
                     else:
-                        raise ValueError(
-                            "Dicts with composite keys (tuples) are not supported in serialized objects. "
-                            'Use "tuple_keys" to define a specific mod_function for these dict-keys.'
-                        )
-                else:
-                    ny_k = Fagus._serializable_value(k, mod_functions)
-            if _is(v, c_abc.Collection):
-                if isinstance(v, (dict, list)):
-                    Fagus._serialize_r(v, mod_functions)
-                else:
-                    ny_v = dict(v.items()) if isinstance(v, c_abc.Mapping) else list(v)
-                    Fagus._serialize_r(ny_v, mod_functions)
-            elif not isinstance(v, (bool, float, int, str)) and v is not None:
-                ny_v = Fagus._serializable_value(v, mod_functions)
-            if ny_k is not _None:
-                node.pop(k)
-                node[ny_k] = v if ny_v is _None else ny_v
-            elif ny_v is not _None:
-                node[k] = ny_v
+                        ny_k = Fagus._serializable_value(k, mod_functions)
+                if _is(v, c_abc.Collection):
+                    if isinstance(v, (dict, list)):
+                        stack.append(v)
+                    else:
+                        ny_v = dict(v.items()) if isinstance(v, c_abc.Mapping) else list(v)
+                        stack.append(ny_v)
+                elif not isinstance(v, (bool, float, int, str)) and v is not None:
+                    ny_v = Fagus._serializable_value(v, mod_functions)
+                if ny_k is not _None:
+                    node_.pop(k)
+                    node_[ny_k] = v if ny_v is _None else ny_v
+                elif ny_v is not _None:
+                    node_[k] = ny_v
         return node
 
     @staticmethod
-    def _serializable_value(
-        value: Any, mod_functions: Mapping[Union[type, Tuple[type], str], Callable[[Any], Any]]
-    ) -> Any:
-        """Returns the value modified through the mod-function for its type"""
-        for types, mod_function in mod_functions.items():
-            if type(value) == types or (_is(types, c_abc.Collection) and type(value) in types):  # type: ignore
-                return mod_function(value)
-        return mod_functions["default"](value)
+    def _serializable_value(value: Any, mod_functions: Mapping[Union[type, str], Callable[[Any], Any]]) -> Any:
+        """Returns the value modified through the mod-function for its type (mod_functions has one type per key)"""
+        mod_function = mod_functions.get(type(value))
+        return (mod_functions["default"] if mod_function is None else mod_function)(value)
 
     def merge(
         self: Collection[Any],
@@ -1326,10 +1409,12 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 types of nodes at root level, e.g. a dict can only be merged with another Mapping, and a list can only
                 be merged with another Iterable. ~ is also raised if a not modifiable root node needs to be modified
         """
-        if new_value_action[0:1] not in "ria":
+        action = new_value_action[0:1]  # only the first letter is significant, so it is only sliced out once
+        if action not in ("r", "i", "a"):
             raise ValueError(
                 f"Invalid new_value_action: {new_value_action}. Valid inputs: (r)eplace, (i)gnore or (a)ppend."
             )
+        fagus = Fagus._opt(self, "fagus", fagus)  # resolved once, and before anything is modified
         node = Fagus.get(self, path, _None, False, copy, path_split)
         if node is _None or not _is(node, c_abc.Collection):
             if isinstance(obj, FagusIterator):
@@ -1342,22 +1427,21 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 object_ = Fagus.__copy__(object_)
             if not copy:
                 Fagus.set(self, object_, path, node_types, list_insert, path_split, False, _None, default_node_type)
-            return Fagus.child(self, object_) if Fagus._opt(self, "fagus", fagus) else object_
+            return Fagus.child(self, object_) if fagus else object_
         base_nodes = [node]
-        iter_options = dict(
-            max_depth=extend_from + update_from,
-            fagus=False,
-            iter_fill=_None,
-            iter_nodes=True,
-            copy=copy_obj,
-            filter_ends=True,
-        )
         if isinstance(obj, FagusIterator):
             obj_iter = obj
-            obj_iter.__dict__.update(**iter_options)
+            obj_iter.max_depth = extend_from + update_from
+            obj_iter.fagus, obj_iter.iter_fill, obj_iter.iter_nodes = False, _None, True
+            obj_iter.copy, obj_iter.filter_ends = copy_obj, True
         elif _is(obj, c_abc.Collection):
             obj_iter = FagusIterator(
-                obj if isinstance(obj, Fagus) else Fagus.child(self, obj), **iter_options  # type: ignore
+                obj if isinstance(obj, Fagus) else Fagus.child(self, obj),  # type: ignore
+                max_depth=extend_from + update_from,
+                iter_fill=_None,
+                iter_nodes=True,
+                copy=copy_obj,
+                filter_ends=True,
             )
         else:
             raise TypeError(f"Can merge with FagusIterator or Collection, but not with {type(obj).__name__}")
@@ -1367,83 +1451,107 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             if obj_type == c_abc.Mapping:
                 if node_type == c_abc.Mapping and not update_from:
                     node.update(obj_iter.obj())
-                    return cast(Collection[Any], Fagus.child(self, node) if Fagus._opt(self, "fagus", fagus) else node)
+                    return cast(Collection[Any], Fagus.child(self, node) if fagus else node)
             elif node_type == c_abc.Set:
                 node.update(obj_iter.obj())
-                return cast(Collection[Any], Fagus.child(self, node) if Fagus._opt(self, "fagus", fagus) else node)
+                return cast(Collection[Any], Fagus.child(self, node) if fagus else node)
             elif node_type == c_abc.Sequence and not extend_from or obj_type != c_abc.Sequence:
                 node.extend(obj_iter.obj())
-                return cast(Collection[Any], Fagus.child(self, node) if Fagus._opt(self, "fagus", fagus) else node)
+                return cast(Collection[Any], Fagus.child(self, node) if fagus else node)
             raise TypeError(
                 f"Unsupported operand types for merge: {node_type.__name__} and {obj_type.__name__}. The types "
                 "have to be equal, additionally a Sequence can be extended with a Set and a Set can be updated "
                 "with anything except from a Mapping."
             )
+        # the types of the nodes in base_nodes are kept in parallel stacks, so they needn't be checked again when going
+        # back up to a node
+        base_types, base_mutable = [node_type], [mutable_node]
+        # the loop below runs for each leaf in obj, so look these up only once
+        mapping, sequence, set_, collection = c_abc.Mapping, c_abc.Sequence, c_abc.Set, c_abc.Collection
+        collection_types = FagusMeta._collection_types  # builtin types are checked first, the abc-checks are slower
+        mutable_node_type, node_type_of = Fagus._mutable_node_type, Fagus._node_type
+        ensure_mutable_node, skip = Fagus._ensure_mutable_node, obj_iter.skip
         for path in obj_iter:
             i = obj_iter.deepest_change
             if i < len(base_nodes):
-                del base_nodes[i + 1 :]
-                node = base_nodes[-1]
-                node_type, mutable_node = Fagus._mutable_node_type(node)
+                del base_nodes[i + 1 :], base_types[i + 1 :], base_mutable[i + 1 :]
+                node, node_type, mutable_node = base_nodes[-1], base_types[-1], base_mutable[-1]
+                if not mutable_node:  # only immutable nodes are checked again, they might have been replaced meanwhile
+                    mutable_node = base_mutable[-1] = mutable_node_type(node)[1]
                 try:
-                    for i, k in enumerate(path[1 + i * 2 : -3 : 2], start=i):
-                        obj_node_type = Fagus._node_type(path[2 * i])
-                        extend_sequence = extend_from <= i and node_type == c_abc.Sequence
-                        if extend_sequence or update_from <= i or node_type == c_abc.Set:
+                    for i in range(i, len(path) // 2 - 1):  # indexes path directly instead of slicing it for each leaf
+                        k, obj_node_type = path[2 * i + 1], node_type_of(path[2 * i])
+                        extend_sequence = extend_from <= i and node_type is sequence
+                        if extend_sequence or update_from <= i or node_type is set_:
                             if not mutable_node:
-                                Fagus._ensure_mutable_node(base_nodes, path[1:-1:2])
+                                node = ensure_mutable_node(base_nodes, path[1 : 2 * len(base_nodes) : 2])
                                 mutable_node = True
-                            getattr(node, "extend" if extend_sequence else "update")(obj_iter.skip(i, copy_obj))
+                            if extend_sequence:
+                                node.extend(skip(i, copy_obj))
+                            else:
+                                node.update(skip(i, copy_obj))
                             raise StopIteration
                         try:
-                            if node_type == obj_node_type:
+                            if node_type is obj_node_type:
                                 new_node = node[k]
-                                if _is(new_node, c_abc.Collection):
+                                if isinstance(new_node, collection_types) or _is(new_node, collection):
                                     node = new_node
-                                    node_type, mutable_node = Fagus._mutable_node_type(node)
+                                    node_type, mutable_node = mutable_node_type(node)
                                     base_nodes.append(node)
+                                    base_types.append(node_type)
+                                    base_mutable.append(mutable_node)
                         except (IndexError, KeyError):
                             if not mutable_node:
-                                node = Fagus._ensure_mutable_node(base_nodes, path[1:-1:2])
+                                node = ensure_mutable_node(base_nodes, path[1:-1:2])
                                 mutable_node = True
-                            if node_type == c_abc.Mapping:
-                                node[k] = obj_iter.skip(i + 1, copy_obj)
-                            elif node_type == c_abc.Sequence:
-                                node.insert(k, obj_iter.skip(i + 1, copy_obj))
+                            if node_type is mapping:
+                                node[k] = skip(i + 1, copy_obj)
+                            elif node_type is sequence:
+                                node.insert(k, skip(i + 1, copy_obj))
                             else:
-                                node.add(obj_iter.skip(i + 1, copy_obj))
+                                node.add(skip(i + 1, copy_obj))
                             raise StopIteration
                 except StopIteration:
                     continue
-            old_value = Fagus.get(node, (path[2 * len(base_nodes) - 1],), _None)
+            leaf_pos = 2 * len(base_nodes)  # position of the value under node in path, its key is right before it
+            leaf_key = path[leaf_pos - 1]
+            try:  # node_type is already known here, so the value is looked up directly instead of using get()
+                if node_type is mapping:
+                    old_value = node[leaf_key]
+                elif node_type is sequence:
+                    old_value = node[leaf_key if type(leaf_key) is int else int(leaf_key)]
+                else:
+                    old_value = _None
+            except (IndexError, ValueError, KeyError):
+                old_value = _None
             if old_value is _None:
                 if not mutable_node:
-                    node = Fagus._ensure_mutable_node(base_nodes, path[1 : 2 * len(base_nodes) : 2])
+                    node = ensure_mutable_node(base_nodes, path[1:leaf_pos:2])
                     mutable_node = True
-                if node_type == c_abc.Mapping:
-                    node[path[2 * len(base_nodes) - 1]] = path[-1]
+                if node_type is mapping:
+                    node[leaf_key] = path[-1]
+                elif node_type is sequence:
+                    node.append(path[-1])
                 else:
-                    getattr(node, "append" if node_type == c_abc.Sequence else "add")(path[-1])
+                    node.add(path[-1])
             else:
-                if new_value_action[0:1] == "i":
+                if action == "i":
                     continue
-                elif new_value_action[0:1] == "a":
+                elif action == "a":
                     if _is(old_value, c_abc.MutableSequence):
                         old_value.append(path[-1])
                         continue
                     new_value = [old_value, path[-1]]
                 else:
-                    new_value = path[2 * len(base_nodes)]
+                    new_value = path[leaf_pos]
                 if not mutable_node:
-                    node = Fagus._ensure_mutable_node(base_nodes, path[1 : 2 * len(base_nodes) : 2])
+                    node = ensure_mutable_node(base_nodes, path[1:leaf_pos:2])
                     mutable_node = True
-                if node_type == c_abc.Set:
+                if node_type is set_:
                     node.add(new_value)
-                elif new_value or not _is(new_value, c_abc.Collection):
-                    node[path[2 * len(base_nodes) - 1]] = new_value
-        return cast(
-            Collection[Any], Fagus.child(self, base_nodes[0]) if Fagus._opt(self, "fagus", fagus) else base_nodes[0]
-        )
+                elif new_value or not (isinstance(new_value, collection_types) or _is(new_value, collection)):
+                    node[leaf_key] = new_value
+        return cast(Collection[Any], Fagus.child(self, base_nodes[0]) if fagus else base_nodes[0])
 
     def pop(
         self: Collection[Any], path: Any = "", default: OptAny = ..., fagus: OptBool = ..., path_split: OptStr = ...
@@ -1464,10 +1572,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         Raises:
             TypeError: if the root node needs to be modified and isn't modifiable (e.g. tuple or frozenset)
         """
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path = Fagus._split_path(self, path, path_split) if not isinstance(path, str) or path else []
         default = Fagus._opt(self, "default", default)
         node: Union[Collection[Any], type] = Fagus._get_mutable_node(self, l_path)
         try:
@@ -1543,7 +1648,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         if _is(node, c_abc.Sequence):
             return range(len(node))
         if isinstance(node, c_abc.Set):
-            return (... for _ in node)
+            return repeat(..., len(node))
         return ()
 
     def values(  # type: ignore
@@ -1572,7 +1677,11 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         if _is(node, c_abc.Collection):
             values = cast(Iterable[Any], node.values() if isinstance(node, c_abc.Mapping) else node)
             if Fagus._opt(self, "fagus", fagus):
-                return (Fagus.child(self, e) if _is(e, c_abc.Collection) else e for e in values)
+                # bound to locals, as the generator below looks them up for each element
+                child, collection_types = Fagus.child, FagusMeta._collection_types
+                return (
+                    child(self, e) if isinstance(e, collection_types) or _is(e, c_abc.Collection) else e for e in values
+                )
             return values
         elif node is _None:
             return ()
@@ -1605,11 +1714,16 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         elif _is(node, c_abc.Sequence):
             items = enumerate(node)
         elif isinstance(node, c_abc.Set):
-            items = ((..., e) for e in node)
+            items = zip(repeat(...), node)
         else:
             return ()
         if Fagus._opt(self, "fagus", fagus):
-            return ((k, Fagus.child(self, v) if _is(v, c_abc.Collection) else v) for k, v in items)
+            # bound to locals, as the generator below looks them up for each element
+            child, collection_types = Fagus.child, FagusMeta._collection_types
+            return (
+                (k, child(self, v) if isinstance(v, collection_types) or _is(v, c_abc.Collection) else v)
+                for k, v in items
+            )
         return items
 
     def clear(  # type: ignore
@@ -1636,10 +1750,7 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             TypeError: if the root node needs to be modified and isn't modifiable (e.g. tuple or frozenset)
         """
         root = Fagus.__copy__(self) if copy else self
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path = Fagus._split_path(self, path, path_split) if not isinstance(path, str) or path else []
         node = Fagus._get_mutable_node(root, l_path, parent=False)
         if node is not _None:
             cast(Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]], node).clear()
@@ -1719,13 +1830,15 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             return None
         if _is(node, c_abc.Sequence):
             if all_:
-                indices = []
+                indices: List[int] = []
+                node_index, add_index = node.index, indices.append  # bound once, they are called for each match
                 try:
                     start = 0 if start is ... else start
                     stop = INF if stop is ... else (stop if stop >= 0 else len(node) + stop)
                     while start < stop:
-                        indices.append(node.index(value, start, stop))
-                        start = indices[-1] + 1
+                        found = node_index(value, start, stop)
+                        add_index(found)
+                        start = found + 1
                 except ValueError:
                     pass
                 return indices
@@ -1817,15 +1930,12 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         root = self.root if isinstance(self, Fagus) else self
         if copy:
             root = Fagus.__copy__(self)
-        if isinstance(path, str):
-            l_path = path.split(Fagus._opt(self, "path_split", path_split)) if path else []
-        else:
-            l_path = list(path) if _is(path, c_abc.Collection) else [path]
+        l_path = Fagus._split_path(self, path, path_split) if not isinstance(path, str) or path else []
         if l_path:
             parent = Fagus._get_mutable_node(root, l_path)
             if parent is _None:
                 raise TypeError(f"Cannot reverse node as root node of type {type(root).__name__} can't be modified.")
-            node = Fagus.get(cast(Collection[Any], parent), l_path[-1], _None, fagus=False)
+            node = Fagus._get_value(parent, l_path[-1])
             if hasattr(node, "reverse"):
                 node.reverse()
             elif isinstance(node, c_abc.Mapping):  # if node.items() isn't reversible, the native error is thrown -> ok
@@ -1853,13 +1963,15 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         return Fagus.child(self, root) if Fagus._opt(self, "fagus", fagus) else root
 
     def copy(self: Collection[Any], deep: bool = False) -> Collection[Any]:
-        """Creates a copy of self. Creates a recursive shallow copy by default, or a copy.deepcopy() if deep is set."""
+        """Creates a copy of self. Creates a recursive shallow copy by default, or a deep copy if deep is set."""
         if deep:
-            return cp.deepcopy(self)
+            new_node = _deepcopy_node(self.root if isinstance(self, Fagus) else self)
+            return Fagus.child(self, new_node) if isinstance(self, Fagus) else new_node
         return Fagus.__copy__(self)
 
-    def __options(  # at runtime, this function is renamed to options (see __init__). That was necessary to not override
-        self,  # options in FagusMeta when Fagus.options() is called, instead of a = Fagus(); a.options(). Little hack
+    @_OptionsMethod  # Fagus.options() runs FagusMeta.options(), this function only runs for a = Fagus(); a.options()
+    def options(
+        self,
         options: Optional[Dict[str, Any]] = None,
         get_default_options: bool = False,
         reset: bool = False,
@@ -1885,15 +1997,96 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             **(self._options if self._options else {}),
         }
 
+    def _split_path(self: Collection[Any], path: Any, path_split: OptStr = ...) -> List[Any]:
+        """Internal function that converts path into a list of keys, a str is split using path_split
+
+        The list is a new object, so it can be modified (e.g. _get_mutable_node() converts list-indices to int in it).
+        Use _path_keys() if the keys are only read.
+
+        Args:
+            path: the path to convert. Can be a str, any other Collection of keys, or a single key
+            path_split: \\* used to split path into a list if path is a str, default ``" "``
+
+        Returns:
+            list of the keys in path
+        """
+        return list(Fagus._path_keys(self, path, path_split))
+
+    def _path_keys(self: Collection[Any], path: Any, path_split: OptStr = ...) -> Sequence[Any]:
+        """Internal function that converts path into a read-only sequence of keys, a str is split using path_split
+
+        Unlike _split_path(), this doesn't copy tuple- and list-paths, and split str-paths are shared from the cache in
+        _split_str(). So the keys must not be modified.
+
+        Args:
+            path: the path to convert. Can be a str, any other Collection of keys, or a single key
+            path_split: \\* used to split path into a list if path is a str, default ``" "``
+
+        Returns:
+            sequence of the keys in path
+        """
+        if isinstance(path, str):
+            if not path:
+                return ()
+            if path_split is not ...:
+                path_split = Fagus.__verify_option__("path_split", path_split)
+            elif isinstance(self, Fagus) and self._options and "path_split" in self._options:
+                path_split = self._options["path_split"]
+            else:
+                path_split = FagusMeta._path_split
+            return _split_str(path, path_split) if path_split in path else (path,)
+        if type(path) in (list, tuple):  # the common cases, skips the slower isinstance-check against Collection
+            return path  # type: ignore
+        return tuple(path) if _is(path, c_abc.Collection) else (path,)
+
+    @staticmethod
+    def _get_value(node: Any, key: Any) -> Any:
+        """Internal function that gets the value at key in node, a single step of get() without the overhead
+
+        Args:
+            node: the node to look up key in
+            key: the key to look up. A str is converted to int if node is a Sequence
+
+        Returns:
+            the value at key in node, or _None if node isn't traversable or key doesn't exist
+        """
+        try:
+            if isinstance(node, c_abc.Mapping):
+                return node[key]
+            if _is(node, c_abc.Sequence):
+                return node[key if type(key) is int else int(key)]
+        except (IndexError, ValueError, KeyError):
+            pass
+        return _None
+
     def _opt(self: Collection[Any], option_name: str, option: OptAny = ...) -> Any:
         """Internal function that is used for Fagus-options (see Fagus-help or README for more information)"""
         if option is not ...:
             return Fagus.__verify_option__(option_name, option)
-        return (
-            self._options[option_name]
-            if isinstance(self, Fagus) and isinstance(self._options, dict) and option_name in self._options
-            else getattr(Fagus, option_name)
-        )
+        if isinstance(self, Fagus) and self._options and option_name in self._options:
+            return self._options[option_name]
+        return FagusMeta._cls_option_values[option_name]  # getattr(Fagus, option_name) is slow, it misses the mro
+
+    @staticmethod
+    def _mutable_path_node(root: Collection[Any], l_path: Sequence[Any], i: int, node: Collection[Any]) -> Any:
+        """Internal function that ensures that node, reached by traversing l_path[:i] from root, is mutable
+
+        The nodes on the path are only collected for _ensure_mutable_node() if node isn't a dict, list or set already
+
+        Returns:
+            the node, but modifiable (a tuple will have turned into a list, a frozenset will have turned into a set)
+        """
+        if type(node) in FagusMeta._mutable_types:
+            return node
+        nodes, keys = [root], []
+        for k in range(i):
+            key = l_path[k]
+            if not isinstance(nodes[-1], c_abc.Mapping) and _is(nodes[-1], c_abc.Sequence):
+                key = int(key)  # the key has already been parsed successfully while traversing, so this won't fail
+            keys.append(key)
+            nodes.append(nodes[-1][key])  # type: ignore
+        keys.append(l_path[i])  # _ensure_mutable_node() only uses the keys between the nodes, this is just padding
+        return Fagus._ensure_mutable_node(nodes, keys)
 
     @staticmethod
     def _ensure_mutable_node(
@@ -1908,6 +2101,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         Returns:
             the node, but modifiable (a tuple will have turned into a list, a frozenset will have turned into a set)
         """
+        if type(nodes[-1]) in FagusMeta._mutable_types:  # the common case, no need to scan nodes for a mutable node
+            return cast(Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]], nodes[-1])
         node = None
         parent_ = int(not parent)
         i = -1
@@ -1918,14 +2113,18 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
             elif i == -len(nodes):
                 raise TypeError(f"Can't modify root node self having the immutable type {type(node).__name__}.")
         for i in range(i, -1):
-            if i == -2 and _is(nodes[i + 1], c_abc.Set, is_not=c_abc.MutableSet):
-                node[path[i + parent_]] = set(nodes[i + 1])  # type: ignore
+            old_node = nodes[i + 1]
+            new_node: Collection[Any]
+            if type(old_node) is tuple:  # the most common immutable node, checked before the abcs
+                new_node = list(old_node)
+            elif i == -2 and _is(old_node, c_abc.Set, is_not=c_abc.MutableSet):
+                new_node = set(old_node)
+            elif isinstance(old_node, c_abc.Mapping):
+                new_node = dict(old_node)
             else:
-                node[path[i + parent_]] = (dict if isinstance(nodes[i + 1], c_abc.Mapping) else list)(  # type: ignore
-                    nodes[i + 1]
-                )
-            nodes[i] = node  # type: ignore
-            node = node[path[i + parent_]]  # type: ignore
+                new_node = list(old_node)
+            node[path[i + parent_]] = new_node  # type: ignore
+            nodes[i + 1] = node = new_node  # the converted node replaces the immutable one in nodes as well
         return cast(Union[MutableMapping[Any, Any], MutableSequence[Any], MutableSet[Any]], node)
 
     def _get_mutable_node(
@@ -1953,13 +2152,14 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         node = self.root if isinstance(self, Fagus) else self
         nodes = [node]
         node_types = Fagus._opt(self, "node_types", node_types)
+        check_types = bool(node_types.strip())  # node_types are only compared at each level if any type is fixed
         try:
             for i in range(len(l_path) - int(parent)):
                 if _is(node, c_abc.Sequence):
-                    if list_insert <= 0 or node_types[i - 1 : i] == "d":
+                    if list_insert <= 0 or check_types and node_types[i - 1 : i] == "d":
                         return _None
                     l_path[i] = int(l_path[i])
-                elif node_types[i - 1 : i] == "l":
+                elif check_types and node_types[i - 1 : i] == "l":
                     return _None
                 node = node[l_path[i]]  # type: ignore
                 nodes.append(node)
@@ -1980,22 +2180,27 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         Returns:
             Returns a tuple: (node-type, mutable) where mutable is a bool
         """
+        tag = FagusMeta._node_type_tags.get(type(node))
+        if tag is not None:
+            return tag
         if isinstance(node, c_abc.MutableMapping):
-            return c_abc.Mapping, True
+            tag = c_abc.Mapping, True
         elif _is(node, c_abc.MutableSequence):
-            return c_abc.Sequence, True
+            tag = c_abc.Sequence, True
         elif isinstance(node, c_abc.MutableSet):
-            return c_abc.Set, True
+            tag = c_abc.Set, True
         elif isinstance(node, c_abc.Mapping):
-            return c_abc.Mapping, False
+            tag = c_abc.Mapping, False
         elif _is(node, c_abc.Sequence):
-            return c_abc.Sequence, False
+            tag = c_abc.Sequence, False
         elif isinstance(node, c_abc.Set):
-            return c_abc.Set, False
+            tag = c_abc.Set, False
         elif isinstance(node, c_abc.Iterable):
-            return c_abc.Iterable, False
+            tag = c_abc.Iterable, False
         else:
-            return type(node), False
+            tag = type(node), False
+        FagusMeta._node_type_tags[type(node)] = tag
+        return tag
 
     @staticmethod
     def _node_type(node: Collection[Any]) -> type:
@@ -2007,16 +2212,21 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         Returns:
             Returns the type of node
         """
+        node_type = FagusMeta._node_type_cache.get(type(node))
+        if node_type is not None:
+            return node_type
         if isinstance(node, c_abc.Mapping):
-            return c_abc.Mapping
+            node_type = c_abc.Mapping
         elif _is(node, c_abc.Sequence):
-            return c_abc.Sequence
+            node_type = c_abc.Sequence
         elif isinstance(node, c_abc.Set):
-            return c_abc.Set
+            node_type = c_abc.Set
         elif isinstance(node, c_abc.Iterable):
-            return c_abc.Iterable
+            node_type = c_abc.Iterable
         else:
-            return type(node)
+            node_type = type(node)
+        FagusMeta._node_type_cache[type(node)] = node_type
+        return node_type
 
     def _hash(self) -> int:
         """Inherited from Set. Overridden to ensure that two equal Fagus's have equal hashes (ignoring options)"""
@@ -2048,19 +2258,24 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
     def __getattr__(self, attr: str) -> Any:  # Enable dot-notation for getting items at a path
         if attr == "root":
             return self.root
-        elif hasattr(Fagus, attr):
-            if isinstance(self._options, dict):
-                return self._options.get(attr, getattr(Fagus, attr))
-            return getattr(Fagus, attr)
-        else:
-            return self.get(attr.lstrip(Fagus._opt(self, "path_split") if isinstance(attr, str) else attr))
+        elif attr in Fagus.__default_options__:
+            return Fagus._opt(self, attr)
+        # one getattr() with a default instead of hasattr() and getattr(), options are already resolved above
+        value = getattr(type(self), attr, _None)
+        if value is not _None:
+            return value
+        options = self._options  # path_split is resolved inline here, as this runs for every step in e.g. a.b.c
+        path_split = options["path_split"] if options and "path_split" in options else FagusMeta._path_split
+        return self.get(attr.lstrip(path_split) if isinstance(attr, str) else attr)
 
     def __getitem__(self, item: Any) -> Any:  # Enable [] access for dict-keys at the top-level
         return self.get(item)
 
     def __setattr__(self, attr: str, value: Any) -> None:  # Enable dot-notation for setting items at a given path
-        if attr in ("root", "_options", "options"):
+        if attr in ("root", "_options", "_root_hash"):
             super(Fagus, self).__setattr__(attr, value)
+            if attr == "root":  # the cached hash belongs to the previous root
+                super(Fagus, self).__setattr__("_root_hash", None)
         elif attr in Fagus.__default_options__:
             if self._options is None:
                 super(Fagus, self).__setattr__("_options", {})
@@ -2068,34 +2283,49 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
                 self._options = {}
             self._options[attr] = Fagus.__verify_option__(attr, value)
         else:
-            self.set(value, attr.lstrip(Fagus._opt(self, "path_split") if isinstance(attr, str) else attr))
+            options = self._options
+            path_split = options["path_split"] if options and "path_split" in options else FagusMeta._path_split
+            self.set(value, attr.lstrip(path_split) if isinstance(attr, str) else attr)
 
     def __setitem__(self, path: Any, value: Any) -> None:  # Enable [] for setting items at a given path
         self.set(value, path)
 
     def __delattr__(self, attr: str) -> None:  # Enable dot-notation for deleting items at a given path
-        if hasattr(Fagus, attr):
+        if attr in _FAGUS_ATTRIBUTES:
             if self._options and attr in self._options:
                 del self._options[attr]
                 if not self._options:
                     self._options = None
         else:
-            self.pop(attr.lstrip(Fagus._opt(self, "path_split") if isinstance(attr, str) else attr))
+            options = self._options
+            path_split = options["path_split"] if options and "path_split" in options else FagusMeta._path_split
+            self.pop(attr.lstrip(path_split) if isinstance(attr, str) else attr)
 
     def __delitem__(self, path: Any) -> None:  # Enable [] for deleting items
         self.pop(path)
 
     def __iter__(self) -> Iterator[Any]:
-        return iter(self.root if isinstance(self.root, c_abc.Mapping) else self.values())
+        root = self.root  # values() is only needed if the subnodes must be wrapped in Fagus, or for unknown types
+        root_type = type(root)
+        if root_type is dict or root_type in FagusMeta._collection_types and not Fagus._opt(self, "fagus"):
+            return iter(root)
+        return iter(root if Fagus._node_type(root) is c_abc.Mapping else self.values())
 
     def __hash__(self) -> int:
-        return hash(self.root)
+        if self._root_hash is not None:
+            return self._root_hash
+        hash_ = hash(self.root)
+        if type(self.root) in (tuple, frozenset):  # hashing these is O(n), and they can't be modified in place
+            self._root_hash = hash_
+        return hash_
 
-    def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Fagus) and self.root == other.root
+    def __eq__(self, other: Any) -> bool:  # the same root is equal to itself, that's checked before comparing it
+        return self is other or isinstance(other, Fagus) and (self.root is other.root or self.root == other.root)
 
     def __ne__(self, other: Any) -> bool:
-        return not isinstance(other, Fagus) or self.root != other.root
+        return self is not other and (
+            not isinstance(other, Fagus) or self.root is not other.root and self.root != other.root
+        )
 
     def __lt__(self, other: Any) -> bool:
         return bool(self.root < (other.root if isinstance(other, Fagus) else other))
@@ -2139,16 +2369,26 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
         return self.child(res) if Fagus._opt(self if isinstance(self, Fagus) else other, "fagus") else res
 
     def __isub__(self, other: Collection[Any]) -> Collection[Any]:  # type: ignore
-        if isinstance(self.root, c_abc.MutableMapping):
+        root = self.root
+        root_type = type(root)  # the builtin types are checked first, the abc-checks are slower
+        if root_type is dict or root_type not in (list, set) and isinstance(root, c_abc.MutableMapping):
             for e in other if _is(other, c_abc.Iterable) else (other,):
-                self.root.pop(e, None)
-        elif isinstance(self.root, c_abc.MutableSequence):
+                root.pop(e, None)  # type: ignore
+        elif root_type is list or root_type is not set and isinstance(root, c_abc.MutableSequence):
             other = set(other.root if isinstance(other, Fagus) else other) if _is(other, c_abc.Iterable) else (other,)
-            for i in (k for k, v in enumerate(self.root) if v in other):
-                self.root.pop(i)
-        elif isinstance(self.root, c_abc.MutableSet):
+            try:  # popping index by index would shift the following indices, so the kept values are collected
+                kept = [v for v in root if v not in other]
+            except TypeError:  # unhashable values in root can't be looked up in a set, but they can be compared
+                other = tuple(other)
+                kept = [v for v in root if v not in other]
+            if root_type is list:
+                root[:] = kept  # type: ignore
+            else:  # slice-assignment is not part of the MutableSequence-interface
+                root.clear()  # type: ignore
+                root.extend(kept)  # type: ignore
+        elif root_type is set or isinstance(root, c_abc.MutableSet):
             for e in other if _is(other, c_abc.Iterable) else (other,):
-                self.root.remove(e)
+                root.remove(e)  # type: ignore
         else:
             raise TypeError(
                 "Unsupported operand types for -=: Can't remove items from self being an immutable "
@@ -2159,10 +2399,13 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
     def __sub__(self, other: Any) -> Collection[Any]:  # type: ignore
         root = self.root if isinstance(self, Fagus) else self
         other = set(other.root if isinstance(other, Fagus) else other) if _is(other, c_abc.Iterable) else (other,)
-        if isinstance(root, c_abc.Mapping):
-            res = {k: v for k, v in root.items() if k not in other}
+        root_type = type(root)  # the builtin types are checked first, the abc-checks are slower
+        res: Collection[Any]
+        if root_type is dict or root_type not in (list, tuple, set, frozenset) and isinstance(root, c_abc.Mapping):
+            res = {k: v for k, v in root.items() if k not in other}  # type: ignore
         else:  # isinstance(self(), (c_abc.Sequence, c_abc.Set)):
-            res = (set if isinstance(root, c_abc.Set) else list)(filter(lambda x: x not in other, root))
+            is_set = root_type in (set, frozenset) or root_type not in (list, tuple) and isinstance(root, c_abc.Set)
+            res = (set if is_set else list)(filter(lambda x: x not in other, root))
         return self.child(res) if Fagus._opt(self if isinstance(self, Fagus) else other, "fagus") else res
 
     def __rsub__(self, other: Collection[Any]) -> Collection[Any]:
@@ -2202,3 +2445,8 @@ class Fagus(c_abc.MutableMapping, c_abc.MutableSequence, c_abc.MutableSet, metac
 
     def __reduce_ex__(self, protocol: Any) -> Union[str, Tuple[Any, ...]]:
         return self.root.__reduce_ex__(protocol)
+
+
+_FAGUS_ATTRIBUTES = frozenset(dir(Fagus)) | frozenset(dir(FagusMeta)) | frozenset(FagusMeta.__default_options__)
+"""Names hasattr(Fagus, name) is True for. FagusMeta doesn't allow to add attributes, so they can be collected once.
+hasattr() is slow for paths in Fagus.__delattr__(), it raises and catches an AttributeError in FagusMeta.__getattr__"""
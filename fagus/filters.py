@@ -2,9 +2,10 @@
 
 import re
 import collections.abc as c_abc
-from typing import Union, Any, Optional, Callable, Tuple, Collection, Set, Dict, List
+from functools import lru_cache
+from typing import Union, Any, Optional, Callable, Tuple, Collection, Dict, List
 
-from .utils import _None, _is
+from .utils import _None, _is, _is_node, FagusMeta
 
 
 __all__ = ("FilBase", "VFil", "KFil", "Fil", "CFil")
@@ -12,10 +13,24 @@ __all__ = ("FilBase", "VFil", "KFil", "Fil", "CFil")
 
 _RE_PATTERN = getattr(re, "Pattern" if hasattr(re, "Pattern") else "_pattern_type")
 
+_RE_ESCAPED_CHAR = re.compile(
+    "[%s]" % re.escape("".join(c for c in map(chr, range(128)) if re.escape(c) != c))
+    + ("|[^\\x00-\\x7f]" if re.escape("\xe9") != "\xe9" else "")  # Python 3.6 escapes all non-ascii characters
+)
+"""Matches if re.escape() would change a str, searching for it is faster than comparing a str to its escaped copy"""
+
+_re_compile = lru_cache(maxsize=1024)(re.compile)
+"""re.compile() with a cache in front, as the same filter-strings are typically compiled over and over again"""
+
+# kinds of filter-elements, KFil._match_args() classifies each element once so that match() can dispatch on these
+_ANY, _SUBFILTER, _CALL, _REGEX, _IN, _EQUAL, _EQUAL_ANY = range(7)
+
 
 class FilBase:
     """FilterBase - base-class for all filters used in Fagus, providing basic functions shared by all filters"""
 
+    __slots__ = ("inexclude",)
+
     def __init__(self, *filter_args: Any, inexclude: str = "") -> None:
         """Basic constructor for all filter-classes used in Fagus
 
@@ -27,7 +42,7 @@ class FilBase:
                 match a. ~ can be used to specify for each argument if the filter shall include it (+) or exclude it
                 (-). Valid example: "++-+". If this parameter isn't specified, all args will be treated as (+).
         """
-        if not bool(re.fullmatch("[+-]*", inexclude)):
+        if not isinstance(inexclude, str) or inexclude.strip("+-"):  # what's left after stripping + and - is invalid
             raise ValueError(
                 "%s is invalid for inexclude. It must be a str consisting of only + (to include) and - (to exclude). "
                 "If nothing has been specified all filters will be treated as include (+)-filters." % inexclude
@@ -57,6 +72,8 @@ class VFil(FilBase):
 
     It can be used to e.g. select all the nodes that contain at least 10 elements. See README for an example"""
 
+    __slots__ = ("invert", "args")
+
     def __init__(self, *filter_args: Any, inexclude: str = "", invert: bool = False) -> None:
         """
 
@@ -88,8 +105,9 @@ class VFil(FilBase):
         Returns:
             bool whether the filter matched
         """
+        inexclude = self.inexclude  # included() inlined, as this runs for every node
         for i, arg in enumerate(self.args):
-            if self.included(i) != (arg(node) if callable(arg) else node == arg):
+            if (inexclude[i : i + 1] != "-") != (arg(node) if callable(arg) else node == arg):
                 return False
         return True
 
@@ -97,6 +115,8 @@ class VFil(FilBase):
 class KFil(FilBase):
     """KeyFilter - Base class for filters in Fagus that inspect key-values to determine whether the filter matched"""
 
+    __slots__ = ("_args", "extra_filters", "_classified_args")
+
     def __init__(self, *filter_args: Any, inexclude: str = "", str_as_re: bool = False) -> None:
         """Initializes KeyFilter and verifies the arguments passed to it
 
@@ -116,17 +136,18 @@ class KFil(FilBase):
             TypeError: if the filters are not stacked correctly / stacked in a way that doesn't make sense
         """
         super().__init__(*filter_args, inexclude=inexclude)
-        self.args = list(self.args)
+        # VFil and CFil found in args, per filter-index. None until the first is found, that's a cheap check in matching
+        self.extra_filters: Optional[Dict[int, List[Union["CFil", VFil]]]] = None
         for i, arg in enumerate(self.args):
-            if str_as_re and isinstance(arg, str) and arg != re.escape(arg):
-                self[i] = re.compile(arg)
+            if str_as_re and isinstance(arg, str) and _RE_ESCAPED_CHAR.search(arg):
+                self[i] = _re_compile(arg)
             elif _is(arg, c_abc.Collection, is_not=c_abc.Mapping):
                 j = 0
                 for e in arg:
-                    if str_as_re and isinstance(e, str) and e != re.escape(e):
+                    if str_as_re and isinstance(e, str) and _RE_ESCAPED_CHAR.search(e):
                         if not isinstance(self[i], c_abc.MutableSequence):
                             self[i] = list(arg)
-                        self[i][j] = re.compile(e)
+                        self[i][j] = _re_compile(e)
                     elif isinstance(e, FilBase):
                         # Sort out CFil and VFil from args to extra_filters. Skip if Fil has a Fil as a child, or CFil
                         # has a CFil as a child
@@ -155,12 +176,27 @@ class KFil(FilBase):
 
     def _set_extra_filter(self, index: int, filter_: Union["CFil", VFil]) -> None:
         """Removes VFil / CFil from args and puts it into extra_filters"""
-        if not hasattr(self, "extra_filters"):
-            self.extra_filters: Dict[int, List[Union["CFil", VFil]]] = {}
+        if self.extra_filters is None:
+            self.extra_filters = {}
         if index not in self.extra_filters:
             self.extra_filters[index] = []
         self.extra_filters[index].append(filter_)
 
+    @property
+    def args(self) -> List[Any]:
+        """The filter-arguments. Change them with ``f.args = ...`` or ``f[i] = ...``, so that they are classified again
+
+        _match_args() doesn't notice if args, or a list in them, is modified in place (e.g. ``f.args.append(...)``).
+        """
+        return self._args
+
+    @args.setter
+    def args(self, args: List[Any]) -> None:
+        self._args = args
+        # no_node and inexclude the args were classified with, and the classified args (see _match_args())
+        self._classified_args: Optional[Tuple[Tuple[type, ...], str, List[Tuple[bool, Tuple[Tuple[int, Any], ...]]]]]
+        self._classified_args = None
+
     def __getitem__(self, index: int) -> Any:
         """Get filter-argument at index
 
@@ -175,6 +211,51 @@ class KFil(FilBase):
     def __setitem__(self, key: int, value: Any) -> None:
         """Set filter-argument at index. Throws IndexError if that index isn't defined"""
         self.args[key] = value
+        self._classified_args = None
+
+    def _match_args(self) -> List[Tuple[bool, Tuple[Tuple[int, Any], ...]]]:
+        """Internal function that classifies the elements of each filter-argument for match() and match_list()
+
+        The filter-arguments don't change while filtering, so the type-checks on them are done once, and not for every
+        key that is matched. They are redone if no_node (which decides whether an argument is a list of elements),
+        inexclude or the arguments are replaced (through the args-property or __setitem__).
+
+        Returns:
+            for each filter-argument: whether it is included, and a tuple of (kind, element) for each element in it
+        """
+        no_node = FagusMeta.no_node
+        classified_args = self._classified_args
+        if classified_args is None or classified_args[0] is not no_node or classified_args[1] != self.inexclude:
+            match_args = []
+            for index, filter_arg in enumerate(self._args):
+                included = self.included(index)
+                elements: List[Tuple[int, Any]] = []
+                for e in filter_arg if _is(filter_arg, c_abc.Collection, is_not=c_abc.Set) else (filter_arg,):
+                    if e is ...:
+                        kind = _ANY
+                    elif isinstance(e, KFil):
+                        kind = _SUBFILTER
+                    elif callable(e):
+                        kind = _CALL
+                    elif isinstance(e, _RE_PATTERN):
+                        kind = _REGEX
+                    elif isinstance(e, c_abc.Set):
+                        kind = _IN
+                    else:
+                        kind = _EQUAL
+                    if kind == _EQUAL and included and elements and elements[-1][0] in (_EQUAL, _EQUAL_ANY):
+                        previous_kind, previous = elements[-1]
+                        try:  # consecutive values to compare with are merged into a set that is checked in one go
+                            elements[-1] = _EQUAL_ANY, frozenset(
+                                previous if previous_kind == _EQUAL_ANY else (previous,)
+                            ).union((e,))
+                            continue
+                        except TypeError:  # unhashable values are compared one by one
+                            pass
+                    elements.append((kind, e))
+                match_args.append((included, tuple(elements)))
+            self._classified_args = classified_args = no_node, self.inexclude, match_args
+        return classified_args[2]
 
     def match(self, value: Any, index: int = 0, _: Any = None) -> Tuple[bool, Optional["KFil"], int]:
         """match filter at index (matches recursively into subfilters if necessary)
@@ -188,24 +269,30 @@ class KFil(FilBase):
             whether the value matched the filter, the filter that matched (as it can be a subfilter), and the next index
                 in that (sub)filter
         """
-        filter_arg, included = self[index], self.included(index)
-        if filter_arg is _None:  # this happens when the filter actually has no argument defined at this index
+        match_args = self._match_args()
+        if index >= len(match_args):  # this happens when the filter actually has no argument defined at this index
             return (
                 True,
                 None,
                 index + 1,
             )  # return True, and None as next filter to prevent unnecessary filtering
-        for e in filter_arg if _is(filter_arg, c_abc.Collection, is_not=c_abc.Set) else (filter_arg,):
-            if e is ...:
+        included, elements = match_args[index]
+        for kind, e in elements:
+            if kind == _ANY:
                 return True, self, index + 1
-            if isinstance(e, KFil):
+            if kind == _SUBFILTER:
                 match, filter_, index_ = e.match(value, 0)  # recursion to correctly handle nested filters
             else:
-                if callable(e):
+                if kind == _EQUAL_ANY:
+                    try:
+                        match = value in e
+                    except TypeError:  # value is unhashable, so it can only be compared
+                        match = any(v == value for v in e)
+                elif kind == _CALL:
                     match = e(value)
-                elif isinstance(e, _RE_PATTERN):
+                elif kind == _REGEX:
                     match = bool(e.fullmatch(value))
-                elif isinstance(e, Set):
+                elif kind == _IN:
                     match = value in e
                 else:
                     match = e == value
@@ -228,20 +315,21 @@ class KFil(FilBase):
         """
         if not isinstance(value, int) or not (-node_length <= value < node_length):
             return False, self, index + 1
-        filter_arg, included = self[index], self.included(index)
-        if filter_arg is _None:
+        match_args = self._match_args()
+        if index >= len(match_args):
             return True, None, index + 1
-        for e in filter_arg if _is(filter_arg, c_abc.Collection, is_not=c_abc.Set) else (filter_arg,):
-            if e is ...:
+        included, elements = match_args[index]
+        for kind, e in elements:
+            if kind == _ANY:
                 return True, self, index + 1
-            if isinstance(e, KFil):
+            if kind == _SUBFILTER:
                 match, filter_, index_ = e.match_list(value, 0, node_length)
             else:
-                if callable(e):
-                    match = e(value)
-                elif isinstance(e, c_abc.Set):
+                if kind == _EQUAL_ANY or kind == _IN:
                     match = value in e
-                else:
+                elif kind == _CALL:
+                    match = e(value)
+                else:  # regex-patterns are compared, as list-indices aren't matched as str
                     match = e == value
                 filter_, index_ = self, index + 1
             if included == match:
@@ -258,8 +346,9 @@ class KFil(FilBase):
         Returns:
             bool whether the extra filters matched
         """
-        if hasattr(self, "extra_filters") and index in self.extra_filters:
-            for filter_ in self.extra_filters[index]:
+        extra_filters = self.extra_filters
+        if extra_filters is not None and index in extra_filters:
+            for filter_ in extra_filters[index]:
                 if filter_.invert == filter_.match_node(node):
                     return False
         return True
@@ -268,12 +357,14 @@ class KFil(FilBase):
 class Fil(KFil):
     """TFilter - what matches this filter will actually be visible in the result. See README"""
 
-    pass
+    __slots__ = ()
 
 
 class CFil(KFil):
     """CFil - can be used to select nodes based on values that shall not appear in the result. See README"""
 
+    __slots__ = ("invert",)
+
     def __init__(self, *filter_args: Any, inexclude: str = "", str_as_re: bool = False, invert: bool = False) -> None:
         """Initializes KeyFilter and verifies the arguments passed to it
 
@@ -306,21 +397,21 @@ class CFil(KFil):
             bool whether the filter matched
         """
         match_key: Optional[Callable[[Any, int, Any], Tuple[bool, Optional["KFil"], int]]] = None
-        if isinstance(node, c_abc.Mapping):
+        node_type = type(node)  # the builtin types are checked first, the abc-checks are slower
+        is_mapping = node_type is dict or node_type not in FagusMeta._sequence_types and isinstance(node, c_abc.Mapping)
+        if is_mapping:
             match_key = self.match
-        elif isinstance(node, c_abc.Sequence):
+        elif node_type in FagusMeta._sequence_types or isinstance(node, c_abc.Sequence):
             match_key = self.match_list
-        for k, v in node.items() if isinstance(node, c_abc.Mapping) else enumerate(node):
-            match_k: Tuple[bool, Optional["KFil"], int] = (
-                match_key(k, index, len(node)) if match_key else (True, self, index)
-            )
-            if match_k[0] and match_k[1] is not None:
-                if _is(v, c_abc.Collection):
-                    match_v = match_k[1].match_node(v, match_k[2])
-                    if match_v:
-                        match_v = match_k[1].match_extra_filters(v, match_k[2] - 1)
-                else:
-                    match_v, *_ = match_k[1].match(v, match_k[2])
-                if match_v:
+        node_length = len(node)
+        filter_: Optional[KFil]
+        for k, v in node.items() if is_mapping else enumerate(node):  # type: ignore
+            match_k, filter_, index_ = match_key(k, index, node_length) if match_key else (True, self, index)
+            if not match_k or filter_ is None:
+                continue
+            if _is_node(v):
+                if filter_.match_node(v, index_) and filter_.match_extra_filters(v, index_ - 1):
                     return True
+            elif filter_.match(v, index_)[0]:
+                return True
         return False
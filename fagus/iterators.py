@@ -11,10 +11,13 @@ from typing import (
     Collection,
     Iterable,
     Tuple,
+    Dict,
+    List,
 )
 import collections.abc as c_abc
+from operator import itemgetter
 
-from .utils import _filter_r, _None, INF, _copy_node, _copy_any, _is
+from .utils import _filter_r, _None, INF, _copy_node, _copy_any, _is_node, FagusMeta
 
 
 __all__ = ("FilteredIterator", "FagusIterator")
@@ -28,6 +31,8 @@ if TYPE_CHECKING:
 class FilteredIterator:
     """Iterator class that gives keys and values for any Collection (use optimal_iterator() to initialize it)"""
 
+    __slots__ = ("filter_", "filter_index", "filter_value", "match_key", "obj", "obj_len", "iter")
+
     @staticmethod
     def optimal_iterator(
         obj: Collection[Any],
@@ -41,43 +46,68 @@ class FilteredIterator:
         as key for each value (as sets have no meaningful keys). If you additionally need filtering, this class is
         initialized to support iteration on only the keys and values that pass the filter"""
         if filter_ is None:
-            if isinstance(obj, c_abc.Sequence):
+            obj_type = type(obj)  # the builtin types are checked first, the abc-checks are slower
+            if (
+                obj_type in FagusMeta._sequence_types
+                or obj_type not in FagusMeta._collection_types
+                and isinstance(obj, c_abc.Sequence)
+            ):
                 return iter(enumerate(obj))
-            elif isinstance(obj, c_abc.Mapping):
-                return iter(obj.items())
+            elif obj_type is dict or obj_type not in FagusMeta._collection_types and isinstance(obj, c_abc.Mapping):
+                return iter(obj.items())  # type: ignore
             else:
                 return ((..., e) for e in obj)
         else:
             return FilteredIterator(obj, filter_value, filter_, filter_index)
 
     def __init__(self, obj: Collection[Any], filter_value: bool, filter_: "Fil", filter_index: int = 0) -> None:
+        self.reset(obj, filter_value, filter_, filter_index)
+
+    def reset(
+        self, obj: Collection[Any], filter_value: bool, filter_: "Fil", filter_index: int = 0
+    ) -> "FilteredIterator":
+        """Internal function. (Re)initializes the iterator to go through obj, so that instances can be reused"""
         self.filter_ = filter_
         self.filter_index = filter_index
         self.filter_value = filter_value
-        self.match_key: Callable[[Any, int, Any], Tuple[bool, Optional[KFil], int]]
-        if isinstance(obj, c_abc.Mapping):
+        self.match_key: Optional[Callable[[Any, int, Any], Tuple[bool, Optional[KFil], int]]]
+        obj_type = type(obj)
+        if obj_type is dict or obj_type not in FagusMeta._collection_types and isinstance(obj, c_abc.Mapping):
             self.match_key = self.filter_.match
-        elif isinstance(obj, c_abc.Sequence):
+        elif (
+            obj_type in FagusMeta._sequence_types
+            or obj_type not in FagusMeta._collection_types
+            and isinstance(obj, c_abc.Sequence)
+        ):
             self.match_key = self.filter_.match_list
-        else:
-            self.match_key = lambda *_: (True, self.filter_, self.filter_index + 1)
+        else:  # the values in sets have no keys to match, only the values are filtered
+            self.match_key = None
         self.obj = obj
+        self.obj_len = len(obj)  # obj isn't resized while it's iterated, so its length is only taken once
         self.iter = self.optimal_iterator(obj)
+        return self
 
     def __iter__(self) -> "FilteredIterator":
         return self
 
     def __next__(self) -> Any:
+        # bound to locals, as the loop below can skip many values before one is returned
+        next_, match_key, filter_index, obj_len = self.iter.__next__, self.match_key, self.filter_index, self.obj_len
+        filter_: Optional[KFil]
         while True:
-            k, v = next(self.iter)
-            match_k, filter_, index = self.match_key(k, self.filter_index, len(self.obj))
+            k, v = next_()
+            if match_key is None:
+                match_k, filter_, index = True, self.filter_, filter_index + 1
+            else:
+                match_k, filter_, index = match_key(k, filter_index, obj_len)
             if not match_k:
                 continue
             if filter_ is not None:
                 if not filter_.match_extra_filters(v, index):
                     continue
-            if _is(v, c_abc.Collection):  # filter v if it is a leaf, either because it is a set or because of the
-                if self.filter_value if isinstance(v, (c_abc.Mapping, c_abc.Sequence)) else True:  # limiting max_items
+            # filter v if it is a leaf, either because it is a set or because of the limiting max_items
+            if _is_node(v):
+                if self.filter_value if isinstance(v, (c_abc.Mapping, c_abc.Sequence)) else True:
                     v = _filter_r(v, False, filter_, index)
             elif filter_ and not filter_.match(v, index)[0]:
                 continue
@@ -89,6 +119,23 @@ class FagusIterator:
 
     Internal - use Fagus.iter() to use this iterator on your object"""
 
+    __slots__ = (
+        "obj",
+        "max_depth",
+        "fagus",
+        "iter_fill",
+        "filter_ends",
+        "copy",
+        "select",
+        "select_getters",
+        "iter_nodes",
+        "iter_keys",
+        "keys",
+        "iterators",
+        "iter_pool",
+        "deepest_change",
+    )
+
     def __init__(
         self,
         obj: "Fagus",
@@ -110,67 +157,100 @@ class FagusIterator:
         self.iter_fill = iter_fill
         self.filter_ends = filter_ends
         self.copy = copy
+        select_type = type(select)
+        if isinstance(select, c_abc.Iterable):
+            select = tuple(select)  # it's used for every value, so a one-shot iterable must not get exhausted
         if not (
             select is None
             or isinstance(select, int)
-            or isinstance(select, c_abc.Iterable)
+            or isinstance(select, tuple)
             and all(isinstance(e, int) for e in select)
         ):
-            raise TypeError(
-                "Invalid type %s for select parameter. Must be int or list of ints." % type(select).__name__
-            )
+            raise TypeError("Invalid type %s for select parameter. Must be int or list of ints." % select_type.__name__)
         self.select = select
+        # functions picking the selected indices from a tuple, per tuple-length. See _select_getter()
+        self.select_getters: Dict[int, Callable[[Tuple[Any, ...]], Tuple[Any, ...]]] = {}
         self.iter_nodes = iter_nodes
         self.iter_keys = [obj if fagus else obj()]
+        self.keys: List[Any] = []  # the keys in iter_keys (iter_keys[1::2]), kept apart to not slice for every value
         self.iterators = [FilteredIterator.optimal_iterator(obj(), filter_ends and not max_depth, filter_)]
+        # FilteredIterators used at each depth before. Only one is active per depth, so they are reused when descending
+        self.iter_pool: Dict[int, FilteredIterator] = {}
         self.deepest_change = 0
 
     def __iter__(self) -> "FagusIterator":
         return self
 
     def __next__(self) -> Any:
-        self.deepest_change = len(self.iterators) - 1
+        # bound to locals, as they are looked up for every value. iterators and the keys are only modified in place
+        iterators, iter_keys, keys = self.iterators, self.iter_keys, self.keys
+        max_depth, fagus = self.max_depth, self.fagus
+        self.deepest_change = len(iterators) - 1
         while True:
             try:
                 try:
-                    k, v, *filter_ = next(self.iterators[-1])
+                    k, v, *filter_ = next(iterators[-1])
                 except IndexError:
                     raise StopIteration
-                if len(self.iterators) - 1 < self.max_depth and v and _is(v, c_abc.Collection):
-                    self.iter_keys.extend((k, self.obj.child(v) if self.fagus else v))
-                    self.iterators.append(
-                        FilteredIterator.optimal_iterator(
-                            v,
-                            self.filter_ends and len(self.iterators) - 2 < self.max_depth,
-                            *filter_,
-                        )
-                    )
+                depth = len(iterators) - 1
+                if depth < max_depth and v and _is_node(v):
+                    iter_keys.extend((k, self.obj.child(v) if fagus else v))
+                    keys.append(k)
+                    # filter_ends filters all the nodes that aren't descended into. These are the ones at max_depth, but
+                    # also empty nodes further up, so it's passed on at every depth (depth < max_depth is given here)
+                    if filter_ and filter_[0] is not None:
+                        pooled = self.iter_pool.get(depth)
+                        if pooled is None:
+                            pooled = self.iter_pool[depth] = FilteredIterator(v, self.filter_ends, *filter_)
+                        else:
+                            pooled.reset(v, self.filter_ends, *filter_)
+                        iterators.append(pooled)
+                    else:
+                        iterators.append(FilteredIterator.optimal_iterator(v, self.filter_ends))
                 else:
-                    if self.fagus and _is(v, c_abc.Collection):
+                    if fagus and _is_node(v):
                         v = self.obj.child(v)
                     iter_list = (
-                        *(self.iter_keys if self.iter_nodes else self.iter_keys[1::2]),
+                        *(iter_keys if self.iter_nodes else keys),
                         k,
                         _copy_any(v) if self.copy else v,
                         *(
-                            (self.iter_fill,) * (self.max_depth - len(self.iterators) + 1)
-                            if self.iter_fill is not _None and self.max_depth < INF
+                            (self.iter_fill,) * (max_depth - depth)
+                            if self.iter_fill is not _None and max_depth < INF
                             else ()
                         ),
                     )
-                    if self.select is not None:
-                        if isinstance(self.select, int):
-                            return iter_list[self.select]
-                        return tuple(iter_list[i] for i in self.select if -len(iter_list) <= i < len(iter_list))
+                    select = self.select
+                    if select is not None:
+                        if isinstance(select, int):
+                            return iter_list[select]
+                        getter = self.select_getters.get(len(iter_list))
+                        return (getter or self._select_getter(len(iter_list)))(iter_list)
                     return iter_list
             except StopIteration:
                 try:
-                    self.iterators.pop()
-                    del self.iter_keys[-2:]
-                    self.deepest_change = len(self.iterators) - 1
+                    iterators.pop()
+                    del iter_keys[-2:]
+                    del keys[-1:]
+                    self.deepest_change = len(iterators) - 1
                 except IndexError:
                     raise StopIteration
 
+    def _select_getter(self, length: int) -> Callable[[Tuple[Any, ...]], Tuple[Any, ...]]:
+        """Internal function that creates a function picking the selected indices from a tuple of a given length
+
+        The indices that are out of range for length are left out. The function is cached in select_getters, so that
+        select only is validated once for each length of tuple, and not for every value that is returned
+        """
+        indices = tuple(i for i in cast(Tuple[int, ...], self.select) if -length <= i < length)
+        getter: Callable[[Tuple[Any, ...]], Tuple[Any, ...]]
+        if len(indices) > 1:
+            getter = itemgetter(*indices)
+        else:  # itemgetter returns the value itself and not a tuple for a single index
+            getter = (lambda t: (t[indices[0]],)) if indices else (lambda t: ())
+        self.select_getters[length] = getter
+        return getter
+
     def skip(self, level: int, copy: bool = False) -> Any:
         """Skip the remaining iterations of a node at a given level if you're done handling it
 
@@ -196,4 +276,5 @@ class FagusIterator:
             node = _copy_node(node)
         del self.iterators[level:]
         del self.iter_keys[level * 2 - 1 :]
+        del self.keys[level - 1 :]
         return node
@@ -3,6 +3,8 @@
 import copy as cp
 import re
 import sys
+from functools import lru_cache
+from types import MethodType
 from abc import ABCMeta
 import collections.abc as c_abc
 from typing import (
@@ -15,6 +17,7 @@ from typing import (
     Tuple,
     Dict,
     Collection,
+    Iterable,
 )
 
 if sys.version_info < (3, 10):
@@ -179,8 +182,67 @@ class FagusMeta(ABCMeta):
     no_node: Tuple[type, ...] = (str, bytes, bytearray)  # if this is changed in class, change in __delattr__ as well
     """Every type of Collection in no_node will not be treated as a node, but as a single value"""
 
+    _sequence_types: Tuple[type, ...] = (list, tuple)
+    _mapping_types: Tuple[type, ...] = (dict,)
+    _collection_types: Tuple[type, ...] = (dict, list, tuple, set, frozenset)
+    _mutable_types: Tuple[type, ...] = (dict, list, set)
+    """Builtin node-types minus no_node. Checking these first is faster than isinstance against the abcs in _is()"""
+
+    _node_type_tags: Dict[type, Tuple[type, bool]] = {
+        dict: (c_abc.Mapping, True),
+        list: (c_abc.Sequence, True),
+        tuple: (c_abc.Sequence, False),
+        set: (c_abc.Set, True),
+        frozenset: (c_abc.Set, False),
+    }
+    """Node-type and mutability per type, so that Fagus._mutable_node_type() only runs the abc-checks once per type
+
+    Other types than the builtin node-types are added the first time they are checked. Types registered at an abc after
+    they were checked once are not reclassified, unless no_node is changed (that resets the cache)"""
+
+    _node_type_cache: Dict[type, type] = {t: tag[0] for t, tag in _node_type_tags.items()}
+    """Node-type per type, so that Fagus._node_type() only runs the abc-checks once per type (see _node_type_tags)"""
+
+    _is_node_cache: Dict[type, bool] = {}
+    """Whether the values of a type are nodes, so that _is_node() only runs the abc-checks once per type"""
+
     _cls_options: Dict[str, FagusOption] = {}
 
+    _cls_option_values: Dict[str, Any] = {k: v.default for k, v in __default_options__.items()}
+    """Cache for the value of every option at class-level (set or default), so that Fagus._opt() needs one lookup"""
+
+    _path_split: str = " "
+    """Cache for path_split at class-level, so that paths can be split without resolving the option every time"""
+
+    def _sync_cache(cls) -> None:
+        """Update the cached class-level options after they have been modified"""
+        FagusMeta._cls_option_values = {
+            k: FagusMeta._cls_options.get(k, v.default) for k, v in FagusMeta.__default_options__.items()
+        }
+        FagusMeta._path_split = FagusMeta._cls_option_values["path_split"]
+
+    def _sync_no_node(cls) -> None:
+        """Update the builtin node-types after no_node has been modified, so that they never contain a no_node-type"""
+        FagusMeta._sequence_types = tuple(t for t in (list, tuple) if not issubclass(t, FagusMeta.no_node))
+        FagusMeta._mapping_types = tuple(t for t in (dict,) if not issubclass(t, FagusMeta.no_node))
+        FagusMeta._collection_types = tuple(
+            t for t in (dict, list, tuple, set, frozenset) if not issubclass(t, FagusMeta.no_node)
+        )
+        FagusMeta._mutable_types = tuple(t for t in (dict, list, set) if not issubclass(t, FagusMeta.no_node))
+        FagusMeta._node_type_tags = {  # only sequences are affected by no_node in _node_type()
+            t: tag
+            for t, tag in (
+                (dict, (c_abc.Mapping, True)),
+                (list, (c_abc.Sequence, True)),
+                (tuple, (c_abc.Sequence, False)),
+                (set, (c_abc.Set, True)),
+                (frozenset, (c_abc.Set, False)),
+            )
+            if tag[0] is not c_abc.Sequence or t in FagusMeta._sequence_types
+        }
+        FagusMeta._node_type_cache = {t: tag[0] for t, tag in FagusMeta._node_type_tags.items()}
+        FagusMeta._is_node_cache = {}
+
     def options(
         cls, options: Optional[Dict[str, FagusOption]] = None, get_default_options: bool = False, reset: bool = False
     ) -> Dict[str, FagusOption]:
@@ -194,10 +256,14 @@ class FagusMeta(ABCMeta):
         Returns:
             a dict of options that are set, or all options if get_default_options is set
         """
+        # all options are verified before any is set, so that an invalid option leaves the options and cache as they are
+        verified_options = {k: cls.__verify_option__(k, v) for k, v in options.items()} if options else None
         if reset:
             cls._cls_options.clear()
-        if options:
-            cls._cls_options.update((k, cls.__verify_option__(k, v)) for k, v in options.items())
+        if verified_options:
+            cls._cls_options.update(verified_options)
+        if reset or verified_options:
+            cls._sync_cache()
         if get_default_options:
             return {k: cls._cls_options.get(k, v.default) for k, v in cls.__default_options__.items()}
         return {k: cls._cls_options[k] for k in cls.__default_options__ if k in cls._cls_options}
@@ -209,30 +275,51 @@ class FagusMeta(ABCMeta):
                     "no_node must be a tuple of types. These are not treated as nodes, default (str, bytes, bytearray)."
                 )
             FagusMeta.no_node = value
+            cls._sync_no_node()
         elif attr in cls.__default_options__:
             FagusMeta._cls_options[attr] = cls.__verify_option__(attr, value)
+            cls._sync_cache()
         elif attr in ("__abstractmethods__", "__annotations__", "__parameters__") or attr.startswith("_abc_"):
             super(FagusMeta, cls).__setattr__(attr, value)
         else:
             raise AttributeError(attr)
 
     def __getattr__(cls, attr: str) -> Any:
-        if attr in cls._cls_options:
-            return cls._cls_options[attr]
-        elif attr in cls.__default_options__:
-            return cls.__default_options__[attr].default
+        if attr in FagusMeta._cls_option_values:  # the class-level value, set or default, is cached there
+            return FagusMeta._cls_option_values[attr]
         return getattr(FagusMeta, attr)
 
     def __delattr__(cls, attr: str) -> None:
         if attr == "no_node":
             FagusMeta.no_node = (str, bytes, bytearray)
+            cls._sync_no_node()
         elif attr in cls._cls_options:
             FagusMeta._cls_options.pop(attr)
+            cls._sync_cache()
         else:
             raise AttributeError(attr)
 
 
-def _filter_r(node: Collection[Any], copy: bool, filter_: Optional["KFil"], index: int = 0) -> Collection[Any]:
+class _OptionsMethod:
+    """Descriptor for Fagus.options(). Runs FagusMeta.options() on the class, and the decorated method on objects
+
+    This allows Fagus to use __slots__, while ``Fagus.options()`` and ``a = Fagus(); a.options()`` still do different
+    things (class-level options vs object-level options).
+    """
+
+    def __init__(self, func: Callable[..., Dict[str, Any]]):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Callable[..., Dict[str, Any]]:
+        if instance is None:
+            return MethodType(FagusMeta.options, owner)
+        return MethodType(self.func, instance)
+
+
+def _filter_r(
+    node: Collection[Any], copy: bool, filter_: Optional["KFil"], index: int = 0, check_extra_first: bool = False
+) -> Collection[Any]:
     """Internal recursive method that facilitates filtering
 
     Args:
@@ -240,43 +327,85 @@ def _filter_r(node: Collection[Any], copy: bool, filter_: Optional["KFil"], inde
         copy: creates copies instead of directly referencing nodes included in the filter
         filter_: TFilter-nodeect in which the filtering-criteria are specified
         index: index in the current filter-nodeect
+        check_extra_first: check the extra filters (CFil, VFil) on node first, return an empty node if they don't match
 
     Returns:
         the filtered node
     """
+    node_type = type(node)  # the builtin types are checked first, the abc-checks are slower
+    is_mapping = node_type is dict or node_type not in FagusMeta._collection_types and isinstance(node, c_abc.Mapping)
+    if filter_ is None:  # there's nothing left to filter, so node is taken over in one go (presized from node)
+        if is_mapping:
+            return {k: _copy_any(v) for k, v in node.items()} if copy else dict(node)  # type: ignore
+        is_sequence = node_type in FagusMeta._sequence_types or isinstance(node, c_abc.Sequence)
+        return (list if is_sequence else set)(map(_copy_any, node) if copy else node)
     new_node: Collection[Any]
-    action: Optional[str]
+    add: Optional[Callable[[Any], Any]]
+    items: Iterable[Tuple[Any, Any]]
     match_key: Optional[Callable[[Any], Any]]
-    if isinstance(node, c_abc.Mapping):
-        new_node, action, match_key = {}, None, filter_.match if filter_ else None
-    elif isinstance(node, c_abc.Sequence):
-        new_node, action, match_key = [], "append", filter_.match_list if filter_ else None
+    if is_mapping:
+        new_node, add, items, match_key = {}, None, node.items(), filter_.match  # type: ignore
+    elif node_type in FagusMeta._sequence_types or isinstance(node, c_abc.Sequence):
+        new_node = []
+        add, items, match_key = new_node.append, enumerate(node), filter_.match_list
     else:
-        new_node, action, match_key = set(), "add", None
-    for k, v in node.items() if isinstance(node, c_abc.Mapping) else enumerate(node):
-        match_k: Tuple[bool, Optional[KFil], int] = (
-            match_key(k, index, len(node)) if callable(match_key) else (True, filter_, index + 1)
-        )
-        if match_k[0]:
-            if match_k[1] is None:
+        new_node = set()
+        add, items, match_key = new_node.add, enumerate(node), None
+    if check_extra_first and not filter_.match_extra_filters(node, index):
+        return new_node
+    node_len = len(node)
+    sub_filter: Optional[KFil]
+    for k, v in items:
+        match_k, sub_filter, sub_index = match_key(k, index, node_len) if match_key else (True, filter_, index + 1)
+        if match_k:
+            copy_v = copy  # filtered nodes are new, and their values are copied already if copy is set
+            if sub_filter is None:
                 match_v = True
-            elif _is(v, c_abc.Collection):
-                if match_k[1].match_extra_filters(v, match_k[2]):
+            elif _is_node(v):
+                if sub_filter.match_extra_filters(v, sub_index):
                     v_old = v
-                    v = _filter_r(v, copy, *match_k[1:])
-                    match_v = bool(v_old) == bool(v)
+                    v = _filter_r(v, copy, sub_filter, sub_index)
+                    # a filtered node only matches if it still has values, or was empty before filtering already
+                    match_v, copy_v = bool(v) or not v_old, False
                 else:
                     match_v = False
             else:
-                match_v, *_ = match_k[1].match(v, match_k[2])
+                match_v = sub_filter.match(v, sub_index)[0]
             if match_v:
-                if action:
-                    getattr(new_node, action)(_copy_any(v) if copy else v)
+                if copy_v and type(v) not in _IMMUTABLE_TYPES:
+                    v = _copy_any(v)
+                if add:
+                    add(v)
                 else:
-                    new_node[k] = _copy_any(v) if copy else v  # type: ignore
+                    new_node[k] = v  # type: ignore
     return new_node
 
 
+_IMMUTABLE_TYPES = frozenset((int, float, complex, bool, str, bytes, type(None), type(...)))
+"""Types whose values can't be changed, so _copy_node() and _copy_any() can use them as they are instead of copying"""
+
+
+_COPY_MAPPING, _COPY_SEQUENCE, _COPY_SET, _COPY_ONLY, _NO_COPY = range(5)
+_COPY_KINDS: Dict[type, int] = {}
+"""How _copy_node() copies a node (see _copy_kind()) per type, so that the checks are only done once per type"""
+
+
+def _copy_kind(node: Collection[Any]) -> int:
+    """Internal function that determines how _copy_node() copies node
+
+    Returns:
+        _COPY_MAPPING, _COPY_SEQUENCE or _COPY_SET if node is copied and its values are copied recursively, _COPY_ONLY
+            if node is only copied using its copy-method, _NO_COPY if node has no copy-method
+    """
+    if not hasattr(node, "copy"):
+        return _NO_COPY
+    if isinstance(node, c_abc.Mapping):
+        return _COPY_MAPPING
+    if isinstance(node, c_abc.Sequence):
+        return _COPY_SEQUENCE
+    return _COPY_SET if isinstance(node, c_abc.MutableSet) else _COPY_ONLY
+
+
 def _copy_node(node: Collection[Any], recursive: bool = False) -> Collection[Any]:
     """Recursive function that creates a recursive shallow copy of node.
 
@@ -289,20 +418,27 @@ def _copy_node(node: Collection[Any], recursive: bool = False) -> Collection[Any
     Returns:
         recursive shallow copy of node
     """
-    if hasattr(node, "copy"):
-        new_node = node if recursive else node.copy()
-        if isinstance(node, (c_abc.Mapping, c_abc.Sequence)):
-            for k, v in node.items() if isinstance(node, c_abc.Mapping) else enumerate(node):
-                collection = _is(v, c_abc.Collection)
+    copy_kind = _COPY_KINDS.get(type(node))
+    if copy_kind is None:
+        copy_kind = _COPY_KINDS[type(node)] = _copy_kind(node)
+    if copy_kind != _NO_COPY:
+        new_node = node if recursive else node.copy()  # type: ignore
+        if copy_kind == _COPY_MAPPING or copy_kind == _COPY_SEQUENCE:
+            for k, v in node.items() if copy_kind == _COPY_MAPPING else enumerate(node):  # type: ignore
+                if type(v) in _IMMUTABLE_TYPES:
+                    continue
+                collection = _is_node(v)
                 if collection or hasattr(v, "copy"):
                     new_node[k] = _copy_node(v) if collection else v.copy()
-        elif isinstance(new_node, c_abc.MutableSet):  # must be a set or similar
+        elif copy_kind == _COPY_SET:
             for v in node:
-                collection = _is(v, c_abc.Collection)
+                if type(v) in _IMMUTABLE_TYPES:
+                    continue
+                collection = _is_node(v)
                 if collection or hasattr(v, "copy"):
-                    new_node.remove(v)
-                    new_node.add(_copy_node(v) if collection else v.copy())
-    elif not any(_is(v, c_abc.Collection) or hasattr(v, "copy") for v in node):
+                    new_node.remove(v)  # type: ignore
+                    new_node.add(_copy_node(v) if collection else v.copy())  # type: ignore
+    elif all(type(v) in _IMMUTABLE_TYPES or not (_is_node(v) or hasattr(v, "copy")) for v in node):
         new_node = node
     elif isinstance(node, tuple):
         new_node = tuple(_copy_node(list(node), True))
@@ -313,15 +449,102 @@ def _copy_node(node: Collection[Any], recursive: bool = False) -> Collection[Any
     return cast(Collection[Any], new_node)
 
 
+def _deepcopy_node(node: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """Creates a deep copy of node, like copy.deepcopy(), but faster for trees of dicts, lists, tuples and sets
+
+    Those types are copied directly. Any other type is handed over to copy.deepcopy() with the same memo, so objects
+    that are referenced several times in node (or recursively) are copied just like copy.deepcopy() would do it.
+
+    Args:
+        node: node to be copied
+        memo: this parameter is internal. When you call this function, always keep it None (default)
+
+    Returns:
+        deep copy of node
+    """
+    node_type = type(node)
+    if node_type in _IMMUTABLE_TYPES:
+        return node
+    if memo is None:
+        memo = {}
+    elif id(node) in memo:
+        return memo[id(node)]
+    if node_type is dict:
+        new_dict = memo[id(node)] = {}  # registered before the children are copied, in case node contains itself
+        for k, v in node.items():
+            new_dict[k if type(k) in _IMMUTABLE_TYPES else _deepcopy_node(k, memo)] = (
+                v if type(v) in _IMMUTABLE_TYPES else _deepcopy_node(v, memo)
+            )
+        return new_dict
+    if node_type is list:
+        new_list = memo[id(node)] = []
+        append = new_list.append
+        for v in node:
+            append(v if type(v) in _IMMUTABLE_TYPES else _deepcopy_node(v, memo))
+        return new_list
+    if node_type is tuple:
+        new_tuple = tuple(v if type(v) in _IMMUTABLE_TYPES else _deepcopy_node(v, memo) for v in node)
+        if id(node) in memo:  # node contained itself through a mutable node, which has created the copy already
+            return memo[id(node)]
+        if all(new is old for new, old in zip(new_tuple, node)):
+            new_tuple = node  # like copy.deepcopy(), reuse the tuple if all its elements are immutable
+        memo[id(node)] = new_tuple
+        return new_tuple
+    if node_type is set or node_type is frozenset:
+        new_set = memo[id(node)] = node_type(
+            v if type(v) in _IMMUTABLE_TYPES else _deepcopy_node(v, memo) for v in node
+        )
+        return new_set
+    return cp.deepcopy(node, memo)
+
+
 def _copy_any(value: Any, deep: bool = False) -> Any:
     """Creates a copy of value. If deep is set, a deep copy is returned, otherwise a shallow copy is returned"""
     if deep:
-        return cp.deepcopy(value)
-    elif _is(value, c_abc.Collection):
+        return _deepcopy_node(value)
+    elif type(value) in _IMMUTABLE_TYPES:
+        return value
+    elif _is_node(value):
         return _copy_node(value)
     return cp.copy(value)
 
 
+def _parse_index(key: Any) -> Any:
+    """Parse key as a list-index. Returns _None if that's not possible
+
+    Most str-keys in paths are not numeric. For those starting with a letter, int() is skipped, as raising and catching
+    the ValueError is far more expensive than checking the first character.
+
+    Args:
+        key: the key to parse
+
+    Returns:
+        key as int, or _None if key can't be parsed as int
+    """
+    if type(key) is int:
+        return key
+    if type(key) is str and (not key or key[0].isalpha()):
+        return _None
+    try:
+        return int(key)
+    except (ValueError, TypeError):
+        return _None
+
+
+@lru_cache(maxsize=4096)
+def _split_str(path: str, path_split: str) -> Tuple[str, ...]:
+    """Cached str.split() for paths. The same paths tend to be used over and over again, so they're only split once
+
+    Args:
+        path: the str to split
+        path_split: the separator to split path on
+
+    Returns:
+        tuple with the keys in path (a tuple, as it is shared between all the callers using the same path)
+    """
+    return tuple(path.split(path_split))
+
+
 def _is(value: Any, *args: type, is_not: Optional[Union[Tuple[type], type]] = None) -> bool:
     """Override of isinstance, making sure that Sequence, Iterable or Collection doesn't match on str or bytearray
 
@@ -331,8 +554,16 @@ def _is(value: Any, *args: type, is_not: Optional[Union[Tuple[type], type]] = No
 
     Returns:
         whether the value is instance of one of the types in args (but not str, bytes or bytearray)"""
-    if is_not is None:
-        return not isinstance(value, FagusMeta.no_node) and isinstance(value, args)
-    if isinstance(is_not, type):
-        return not isinstance(value, FagusMeta.no_node + (is_not,)) and isinstance(value, args)
-    return not isinstance(value, FagusMeta.no_node + is_not) and isinstance(value, args)
+    if isinstance(value, FagusMeta.no_node):  # isinstance() takes a type or a tuple of types for is_not, too
+        return False
+    return (is_not is None or not isinstance(value, is_not)) and isinstance(value, args)
+
+
+def _is_node(value: Any) -> bool:
+    """Same as _is(value, c_abc.Collection), but the result is cached per type, as this is checked for every value
+
+    Types registered at Collection after they were checked once are not reclassified, unless no_node is changed"""
+    is_node = FagusMeta._is_node_cache.get(type(value))
+    if is_node is None:
+        is_node = FagusMeta._is_node_cache[type(value)] = _is(value, c_abc.Collection)
+    return is_node
@@ -10,7 +10,7 @@ import doctest
 from ipaddress import IPv6Address, IPv4Network, IPv6Network, ip_address
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Dict, cast, Collection, Set
+from typing import Any, Dict, List, cast, Collection, Set
 import collections.abc as c_abc
 
 from fagus import Fagus, Fil, CFil, VFil
@@ -47,6 +47,11 @@ class TestFagus(unittest.TestCase):
         a.c_e = {"a_haa_k": 72}
         a.path_split = "__"
         self.assertEqual(72, a.c__e__a_haa_k, "Using dot-notation with __ as path_split to get keys with _ inside")
+        self.assertEqual(
+            ("Fagus", Fagus.mro()),
+            (a.__name__, a.mro()),
+            "Attributes that aren't options or keys are looked up on the class of the Fagus-object",
+        )
         del Fagus.default
 
     def test_iter(self) -> None:
@@ -119,6 +124,11 @@ class TestFagus(unittest.TestCase):
             list(a.iter(path=("1", 0, 3), filter_=Fil(1, ..., "q", inexclude="++-"), select=-1)),
             "Correctly filtering a set in the end",
         )
+        self.assertEqual(
+            [(0, 3), (0, 4), (1, 1)],
+            list(a.iter(path="a", select=(i for i in (0, -1, 5)))),
+            "select can be a one-shot iterable, indices out of range are left out",
+        )
         self.assertEqual(
             [(3, [{"a"}])],
             list(a.iter(0, ("1", 0), Fil(3, 1, ..., "q", inexclude="+++-"), filter_ends=True)),
@@ -270,6 +280,21 @@ class TestFagus(unittest.TestCase):
             Fagus.filter(self.a, filter_=Fil(..., lambda x: x % 2, inexclude="--"), copy=True),
             "Filtering using a lambda on the default test-datastructure",
         )
+        f = Fil("a")
+        self.assertEqual({"a": 1}, Fagus.filter({"a": 1, "b": 2}, filter_=f), "The filter-args are classified")
+        f[0] = "b"
+        self.assertEqual({"b": 2}, Fagus.filter({"a": 1, "b": 2}, filter_=f), "Changed args are classified again")
+        f.inexclude = "-"
+        self.assertEqual({"a": 1}, Fagus.filter({"a": 1, "b": 2}, filter_=f), "Changed inexclude is applied, too")
+        f = Fil(["a"], "b")
+        b = {"a": {"b": 1}, "x": {"b": 3}}
+        self.assertEqual({"a": {"b": 1}}, Fagus.filter(b, f, copy=True), "Filtering with a list as filter-arg")
+        f.args = [["a", "x"], "b", 3]
+        self.assertEqual({"x": {"b": 3}}, Fagus.filter(b, f, copy=True), "New args assigned to args are classified")
+        f[1] = "c"
+        self.assertEqual({}, Fagus.filter(b, f, copy=True), "An arg replaced through __setitem__ is classified again")
+        f.args = [["a"]]
+        self.assertEqual({"a": {"b": 1}}, Fagus.filter(b, f, copy=True), "New args assigned to args are classified")
         with open(self.test_data_path) as fp:
             a = Fagus(json.load(fp))
         self.assertEqual(
@@ -354,6 +379,18 @@ class TestFagus(unittest.TestCase):
             "Verifying that a value-filter also works if it comes as a standalone argument, then including all the "
             "subnodes the filter matches (in this case all).",
         )
+        self.assertEqual(
+            {"a": 1, "c": [3]},
+            Fagus.filter({"a": 1, "b": 2, "c": [3]}, filter_=Fil(["a", "c", [3], "d"], ...)),
+            "Several values in one filter-argument match like one, even with an unhashable value in between",
+        )
+        filter_copy = copy.copy(Fil("a"))
+        filter_copy.args = ["x"]
+        self.assertEqual(
+            {"x": 2},
+            Fagus.filter({"a": 1, "x": 2}, filter_=filter_copy),
+            "A copied filter matches with its own args, and not with the args of the filter it was copied from",
+        )
 
     def test_split(self) -> None:
         split_res = (
@@ -410,6 +447,9 @@ class TestFagus(unittest.TestCase):
         in_, out = a.split(Fil("a"), copy=True)
         self.assertEqual({}, in_, "If the filter matches nothing, in_ must be an empty list")
         self.assertEqual(a(), out, "If the filter matches nothing, in_ must be equal to the original node")
+        in_, out = a.split(Fil(CFil("a")), copy=True)
+        self.assertEqual(({}, a()), (in_, out), "If the root extra filter fails, everything goes to out")
+        self.assertIsNot(a["data"], out["data"], "out is a copy, as copy is set")
         self.assertEqual(
             ("a", "a"), a.split(Fil(), "a", default="a"), "Default is returned for in_ and out if path doesn't exist"
         )
@@ -591,6 +631,7 @@ class TestFagus(unittest.TestCase):
         self.assertEqual(a.setdefault("a 7 7", 5, node_types="ll"), 5, "SetDefault returns default value")
         b["a"].append([5])
         self.assertEqual(a(), b, "SetDefault has added the value to the list")
+        self.assertEqual(Fagus.setdefault({"a b": 1}, ["a b"], 5), 1, "A key containing path_split isn't split again")
 
     def test_mod(self) -> None:
         a = Fagus(self.a, copy=True)
@@ -719,6 +760,10 @@ class TestFagus(unittest.TestCase):
             ),
             "Complex mod-functions with function pointer, args, kwargs, lambdas and tuple-types, overriding default",
         )
+        deep: List[Any] = [(1,)]
+        for _ in range(2000):
+            deep = [deep]
+        self.assertEqual([1], Fagus.get(Fagus.serialize(deep), (0,) * 2001), "Nodes deeper than the recursion-limit")
 
     def test_merge(self) -> None:
         b = {"a": {"b": {"c": 5}}, "d": "e"}
@@ -781,6 +826,11 @@ class TestFagus(unittest.TestCase):
         self.assertRaisesRegex(TypeError, "Unsupported operand types", Fagus.merge, set(), {})
         self.assertRaisesRegex(TypeError, "Unsupported operand types", Fagus.merge, [1, 2, 3], {})
         self.assertRaisesRegex(TypeError, "Unsupported operand types", Fagus.merge, {}, [1, 2, 3])
+        self.assertEqual(
+            {"x": {"y": [3, 4]}},
+            Fagus.merge({"x": {"y": (1, 2)}}, {"x": {"y": [3, 4]}}),
+            "A tuple is converted to a list only once, so all its replaced values are kept",
+        )
         with open(self.test_data_path) as fp:
             a = Fagus(json.load(fp))
         self.assertEqual(
@@ -818,6 +868,9 @@ class TestFagus(unittest.TestCase):
         )
         self.assertEqual([1, 2, 3], Fagus([{"a": 1}]) + [1, 2, 3], "Testing the plus (+) operator")
         self.assertEqual([{"a": 1}, 2, 3], [1, 2, 3] + Fagus([{"a": 1}]), "Testing the plus (+) operator from right")
+        b = {"a": 1}
+        self.assertRaisesRegex(TypeError, "Can't apply fagus", Fagus.merge, b, {"b": 2}, fagus="yes")
+        self.assertEqual({"a": 1}, b, "An invalid fagus-option is raised before anything is merged")
 
     def test_pop(self) -> None:
         a = Fagus(self.a, copy=True)
@@ -1015,6 +1068,16 @@ class TestFagus(unittest.TestCase):
         b = Fagus(a, copy=True)
         b.pop("1 0 3")
         self.assertNotEqual(a, b(), "Can pop deeply in the object without affecting the original object")
+        b = Fagus.set(a, 5, "1 0 0", copy=True)
+        b["a"][0].append(6)  # type: ignore
+        self.assertEqual(self.a, a, "The copy made by set() shares no nodes with a, not even outside the path")
+        b = Fagus(a, default=4).copy(deep=True)  # type: ignore
+        self.assertEqual((Fagus, a, 4), (type(b), b(), b.default), "a deep copy of a Fagus-object is a Fagus-object")
+        b["1 0 3 1"].add("b")
+        self.assertEqual(self.a, a, "A deep copy shares no nodes with the original object")
+        c = [1]
+        d = Fagus.copy({"a": c, "b": (c, 2)}, deep=True)
+        self.assertTrue(d["a"] is d["b"][0] and d["a"] is not c, "nodes referenced twice are copied once")
 
     def test_repr(self) -> None:
         a = Fagus({"a": 9, "c": [1, 2, False]}, path_split="_", fagus=True)
@@ -1024,6 +1087,14 @@ class TestFagus(unittest.TestCase):
 
     # tests for the + and +=-operators are in test_merge, test_add tests the add-function
 
+    def test_hash(self) -> None:
+        a = Fagus((1, (2, 3)))
+        self.assertEqual(hash((1, (2, 3))), hash(a), "Fagus hashes like its root")
+        self.assertEqual(hash((1, (2, 3))), hash(a), "The cached hash is returned the second time")
+        a.root = frozenset({4})
+        self.assertEqual(hash(frozenset({4})), hash(a), "The cached hash is reset when root is replaced")
+        self.assertRaises(TypeError, hash, Fagus([1]))
+
     def test_sub(self) -> None:
         a = Fagus(self.a, copy=True)
         self.assertEqual({"a": [[3, 4], {"b": 1}]}, a - {"1"}, "Removing keys from root dict")
@@ -1032,7 +1103,10 @@ class TestFagus(unittest.TestCase):
         self.assertEqual(self.a, a(), "a was not modified by these operations")
         b = Fagus(a["1 0"], copy=True)
         b -= [1, "a"]  # type: ignore
-        self.assertEqual([True, ("f", {"a", "q"})], b(), "isub removes items as it should")
+        self.assertEqual([("f", {"a", "q"})], b(), "isub removes items as it should (True == 1 is removed, too)")
+        c = Fagus([1, 1, 2, 1, 3])
+        c -= 1
+        self.assertEqual([2, 3], c(), "isub removes all occurrences, also when they are adjacent")
         self.assertRaisesRegex(TypeError, "Unsupported operand types for -=", Fagus(("a", "b")).__isub__, ("a",))
         self.assertEqual([8, 9], (6, 8, 7, 9, 11) - Fagus({6, 7, 11}), "rsub with a set on a tuple gives a list")
         self.assertEqual({8, 9}, frozenset({6, 8, 7, 9}) - Fagus((6, 7)), "rsub with a tuple on a set gives a set")
@@ -1100,6 +1174,25 @@ class TestFagus(unittest.TestCase):
         )
         self.assertRaisesRegex(ValueError, "The only allowed characters in node", Fagus.options, {"node_types": "fpg"})
         self.assertEqual({}, Fagus.options(reset=True), "All options have been removed at class level and not replaced")
+        b = {"a": {"b": 1}, "a/b": 2}
+        Fagus.path_split = "/"
+        self.assertEqual(1, Fagus.get(b, "a/b"), "path_split set at class-level is used to split paths")
+        Fagus.options({"path_split": "."})
+        self.assertEqual((2, 1), (Fagus.get(b, "a/b"), Fagus.get(b, "a.b")), "path_split updated by options()")
+        del Fagus.path_split
+        self.assertEqual((2, 1), (Fagus.get(b, "a/b"), Fagus.get(b, "a b")), "path_split reset after deleting it")
+        self.assertRaises(ValueError, Fagus.options, {"path_split": "/", "node_types": "fpg"})
+        self.assertEqual(
+            ({}, " ", 1),
+            (Fagus.options(), Fagus.path_split, Fagus.get(b, "a b")),
+            "No option is set if one of the options passed to options() is invalid",
+        )
+        Fagus.no_node = (str, bytes, bytearray, tuple)
+        c = Fagus({"a": (1, 2)})
+        self.assertEqual([("a", (1, 2))], list(c.iter()), "tuple in no_node is a leaf, also for the builtin fast-path")
+        self.assertEqual({"a": {"0": 5}}, c.set(5, "a 0"), "the tuple is a leaf, so it is replaced by a new node")
+        del Fagus.no_node
+        self.assertEqual([("a", "0", 5)], list(c.iter()), "no_node is reset after deleting it")
 
 
 def main() -> None: